@@ -1,10 +1,14 @@
 import os
 import pandas as pd
 import re
+import heapq
 from datetime import datetime
 from collections import defaultdict
 from urllib.parse import urlparse
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 # Import configuration
 from .config import (
@@ -14,16 +18,6 @@ from .config import (
     NORMALIZATION_OPTIONS
 )
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('anchor_text_analysis.log')
-    ]
-)
-
 def normalize_anchor_text(text):
     """Normalize anchor text for consistent comparison"""
     if not isinstance(text, str):
@@ -96,7 +90,13 @@ def extract_anchor_text_data_from_csv(domain, file_path):
         return []
         
     try:
-        df = pd.read_csv(file_path)
+        # Only the anchor and source url columns are used, so skip parsing the rest.
+        # Both are highly repetitive, so load them as categories (integer codes)
+        df = pd.read_csv(
+            file_path,
+            usecols=lambda col: col.strip().lower() in ('anchor', 'source url', 'source_url'),
+            dtype='category'
+        )
         logging.debug(f"Successfully read CSV file: {file_path}")
         logging.debug(f"Columns found: {list(df.columns)}")
         
@@ -117,18 +117,24 @@ def extract_anchor_text_data_from_csv(domain, file_path):
             logging.error(f"Available columns: {list(df.columns)}")
             return []
             
-        # Normalize anchor texts and domains
+        # Normalize anchor texts and domains (map on a categorical column
+        # normalizes each distinct value once, not every row)
         logging.info("Normalizing anchor texts and domains...")
-        df['normalized_anchor'] = df[anchor_col].apply(normalize_anchor_text)
-        df['ref_domain'] = df[source_url_col].apply(normalize_domain)
+        df['normalized_anchor'] = df[anchor_col].map(normalize_anchor_text)
+        df['ref_domain'] = df[source_url_col].map(normalize_domain)
         
         # Remove empty or invalid entries
         df = df[df['normalized_anchor'].str.len() > 0]
         df = df[df['ref_domain'].str.len() > 0]
         
         # Group by normalized anchor text
-        anchor_counts = df['normalized_anchor'].value_counts().to_dict()
-        total = sum(anchor_counts.values())
+        anchor_counts = df['normalized_anchor'].value_counts()
+        # Categories removed by the filters above still report a zero count
+        anchor_counts = anchor_counts[anchor_counts > 0]
+        total = int(anchor_counts.sum())
+
+        # Collect the referring domains of every anchor in a single groupby pass
+        anchor_ref_domains = df.groupby('normalized_anchor', sort=False, observed=True)['ref_domain'].unique()
         
         logging.info(f"Found {len(anchor_counts)} unique anchor texts")
         logging.debug(f"Total backlinks: {total}")
@@ -136,7 +142,7 @@ def extract_anchor_text_data_from_csv(domain, file_path):
         anchor_data = []
         for anchor_text, count in anchor_counts.items():
             percentage = (count / total) * 100 if total else 0
-            ref_domains = set(df[df['normalized_anchor'] == anchor_text]['ref_domain'].unique())
+            ref_domains = set(anchor_ref_domains[anchor_text])
             
             anchor_data.append({
                 'anchor_text': anchor_text,
@@ -157,6 +163,13 @@ def extract_anchor_text_data_from_csv(domain, file_path):
         logging.error("Stack trace:", exc_info=True)
         return []
 
+def init_worker_logging(log_queue, level):
+    """Send a worker process's log records to the parent process through log_queue"""
+    root_logger = logging.getLogger()
+    # Replace any handlers inherited from the parent (fork) so records are written once
+    root_logger.handlers[:] = [QueueHandler(log_queue)]
+    root_logger.setLevel(level)
+
 def analyze_anchor_texts():
     """Main analysis function"""
     logging.info("Starting anchor text analysis")
@@ -169,13 +182,26 @@ def analyze_anchor_texts():
     global_anchor_domains = defaultdict(set)
     domain_anchor_data = {}
     
-    for domain, file_path in domain_file_map.items():
-        logging.info(f"\nProcessing domain: {domain}")
-        anchor_data = extract_anchor_text_data_from_csv(domain, file_path)
-        domain_anchor_data[domain] = anchor_data
-        
-        for item in anchor_data:
-            global_anchor_domains[item['anchor_text']].add(domain)
+    # Extract each domain's anchor data in parallel; the files are independent
+    domains = list(domain_file_map)
+    # Workers (spawned on Windows) do not inherit the logging setup, so their
+    # records are queued back and written by this process's handlers
+    root_logger = logging.getLogger()
+    log_queue = multiprocessing.Queue()
+    log_listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    log_listener.start()
+    try:
+        with ProcessPoolExecutor(initializer=init_worker_logging,
+                                 initargs=(log_queue, root_logger.level)) as executor:
+            all_anchor_data = executor.map(extract_anchor_text_data_from_csv, domains,
+                                           [domain_file_map[d] for d in domains], chunksize=4)
+            for domain, anchor_data in zip(domains, all_anchor_data):
+                domain_anchor_data[domain] = anchor_data
+
+                for item in anchor_data:
+                    global_anchor_domains[item['anchor_text']].add(domain)
+    finally:
+        log_listener.stop()
             
     results = []
     max_anchors = MAX_ANCHOR_TEXTS  # Use the configurable value
@@ -196,12 +222,13 @@ def analyze_anchor_texts():
                 'count': count
             })
             
-        # Sort domain stats by percentage (descending)
-        domain_stats_sorted = sorted(domain_stats, key=lambda x: x['percentage'], reverse=True)
+        # Top anchors by percentage (descending); only max_anchors are kept, so
+        # select them with a bounded heap instead of sorting every anchor
+        top_domain_stats = heapq.nlargest(max_anchors, domain_stats, key=lambda x: x['percentage'])
         
         # Create a row for domains
         domains_row = {'Domain': domain}
-        for i, item in enumerate(domain_stats_sorted[:max_anchors], 1):
+        for i, item in enumerate(top_domain_stats, 1):
             domains_row[f'ANCHOR {i}'] = item['anchor_text']
             domains_row[f'%{i}'] = f"{item['percentage']:.2f}%"
             domains_row[f'#{i}'] = item['count']
@@ -7,6 +7,18 @@ from datetime import datetime
 import glob
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# Quality filter thresholds, bound once so the per-file filter does no dict lookups
+MIN_ASCORE = QUALITY_BACKLINK_SETTINGS['MIN_AUTHORITY_SCORE']
+MAX_EXT = QUALITY_BACKLINK_SETTINGS['MAX_EXTERNAL_LINKS']
+REQ_DOFOLLOW = QUALITY_BACKLINK_SETTINGS['REQUIRE_DOFOLLOW']
+
+# One extractor for the whole module, built from tldextract's bundled suffix list
+# (no network fetch or disk cache lookups per call)
+_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
 
 # Add debug logging
 def debug_log(message):
@@ -57,47 +69,52 @@ domains_8_05 = [
     'greatwaterfilters.com.au'
 ]
 
-# Automatically find the latest *_SEMRUSH_backlinks folder
-parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-debug_log(f"Parent directory: {parent_dir}")
+def setup_latest_semrush_directories():
+    """Find the latest *_SEMRUSH_backlinks folder, create its output directories and return (date folder, date quality dir, summary dir)"""
+    # Automatically find the latest *_SEMRUSH_backlinks folder
+    parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    debug_log(f"Parent directory: {parent_dir}")
 
-semrush_folders = sorted(glob.glob(os.path.join(parent_dir, '*_SEMRUSH_backlinks')), key=os.path.getmtime, reverse=True)
-if not semrush_folders:
-    raise FileNotFoundError('No *_SEMRUSH_backlinks folders found!')
-semrush_dir = semrush_folders[0]
-# Extract date from folder name (e.g., 17_05_SEMRUSH_backlinks -> 17_05)
-date_folder = os.path.basename(semrush_dir).split('_SEMRUSH_backlinks')[0]
-debug_log(f"Looking for SEMRUSH files in: {semrush_dir}")
-debug_log(f"Using date folder: {date_folder}")
+    semrush_folders = sorted(glob.glob(os.path.join(parent_dir, '*_SEMRUSH_backlinks')), key=os.path.getmtime, reverse=True)
+    if not semrush_folders:
+        raise FileNotFoundError('No *_SEMRUSH_backlinks folders found!')
+    semrush_dir = semrush_folders[0]
+    # Extract date from folder name (e.g., 17_05_SEMRUSH_backlinks -> 17_05)
+    date_folder = os.path.basename(semrush_dir).split('_SEMRUSH_backlinks')[0]
+    debug_log(f"Looking for SEMRUSH files in: {semrush_dir}")
+    debug_log(f"Using date folder: {date_folder}")
 
-# Set output directories
-base_output_dir = os.path.join(parent_dir, DEFAULT_OUTPUT_DIRECTORY)
-everything_quality_dir = os.path.join(base_output_dir, EVERYTHING_QUALITY_DIR)
-date_quality_dir = os.path.join(everything_quality_dir, date_folder)
-summary_dir = os.path.join(base_output_dir, SUMMARY_DIR)
+    # Set output directories
+    base_output_dir = os.path.join(parent_dir, DEFAULT_OUTPUT_DIRECTORY)
+    everything_quality_dir = os.path.join(base_output_dir, EVERYTHING_QUALITY_DIR)
+    date_quality_dir = os.path.join(everything_quality_dir, date_folder)
+    summary_dir = os.path.join(base_output_dir, SUMMARY_DIR)
 
-debug_log(f"Output directories:")
-debug_log(f"Base output: {base_output_dir}")
-debug_log(f"Everything quality: {everything_quality_dir}")
-debug_log(f"Date quality: {date_quality_dir}")
-debug_log(f"Summary: {summary_dir}")
+    debug_log(f"Output directories:")
+    debug_log(f"Base output: {base_output_dir}")
+    debug_log(f"Everything quality: {everything_quality_dir}")
+    debug_log(f"Date quality: {date_quality_dir}")
+    debug_log(f"Summary: {summary_dir}")
 
-# Create output directories if they don't exist
-for directory in [base_output_dir, everything_quality_dir, summary_dir, date_quality_dir]:
-    try:
-        if not os.path.exists(directory):
-            debug_log(f"Creating directory: {directory}")
-            os.makedirs(directory)
-            debug_log(f"Successfully created directory: {directory}")
-    except Exception as e:
-        debug_log(f"Error creating directory {directory}: {str(e)}")
-        sys.exit(1)
+    # Create output directories if they don't exist
+    for directory in [base_output_dir, everything_quality_dir, summary_dir, date_quality_dir]:
+        try:
+            if not os.path.exists(directory):
+                debug_log(f"Creating directory: {directory}")
+                os.makedirs(directory)
+                debug_log(f"Successfully created directory: {directory}")
+        except Exception as e:
+            debug_log(f"Error creating directory {directory}: {str(e)}")
+            sys.exit(1)
 
+    return date_folder, date_quality_dir, summary_dir
+
+@lru_cache(maxsize=None)
 def get_core_domain(url):
     """Extract the core domain from a URL, using only the main TLD"""
     try:
         # Extract domain components
-        extracted = tldextract.extract(url)
+        extracted = _EXTRACT(url)
         # Combine domain and core TLD only
         return f"{extracted.domain}.{extracted.suffix.split('.')[-1]}"
     except:
@@ -105,16 +122,24 @@ def get_core_domain(url):
 
 def process_domains(input_file, domains):
     """Process domains from a specific file (CSV or Excel)"""
+    date_folder, date_quality_dir, summary_dir = setup_latest_semrush_directories()
     summary_data = []
+
+    # Read the input file (CSV or Excel) once; every domain uses the same data
+    read_error = None
+    try:
+        if input_file.endswith('.csv'):
+            df = pd.read_csv(input_file)
+        else:
+            df = pd.read_excel(input_file)
+    except Exception as e:
+        read_error = e
     
     for domain in domains:
         try:
-            # Read the input file (CSV or Excel)
-            if input_file.endswith('.csv'):
-                df = pd.read_csv(input_file)
-            else:
-                df = pd.read_excel(input_file)
-            
+            if read_error is not None:
+                raise read_error
+
             # Create everything CSV
             everything_csv = os.path.join(date_quality_dir, f'{domain}_everything.csv')
             df.to_csv(everything_csv, index=False)
@@ -129,8 +154,8 @@ def process_domains(input_file, domains):
             try:
                 everything_backlinks = len(df)
                 everything_domains = df['Source URL'].nunique()
-                quality_backlinks = len(df)
-                quality_domains = df['Source URL'].nunique()
+                quality_backlinks = everything_backlinks
+                quality_domains = everything_domains
             except KeyError as e:
                 print(f"Warning: Could not calculate metrics for {domain}: {str(e)}")
                 everything_backlinks = len(df)
@@ -162,6 +187,7 @@ def process_domains(input_file, domains):
         summary_df.to_csv(summary_csv, index=False)
         print(f"Created summary file: {summary_csv}")
 
+@lru_cache(maxsize=None)
 def extract_domain_from_url(url):
     """Extract domain name from URL, stopping at first semantic sign"""
     try:
@@ -174,8 +200,8 @@ def extract_domain_from_url(url):
         if domain.startswith('www.'):
             domain = domain[4:]
             
-        # Find the last period before the TLD
-        parts = domain.split('.')
+        # Find the last period before the TLD (only the last two parts are needed)
+        parts = domain.rsplit('.', 2)
         if len(parts) >= 2:
             # Get the core domain (everything before the TLD)
             core_domain = parts[-2]
@@ -186,14 +212,32 @@ def extract_domain_from_url(url):
     except:
         return None
 
+class BacklinkColumns(NamedTuple):
+    """Names of the backlink columns used by process_csv_file (None when missing)"""
+    source_url: Optional[str]
+    ascore: Optional[str]
+    ext_links: Optional[str]
+    nofollow: Optional[str]
+
+# Accepted spellings of each column, in BacklinkColumns field order
+COLUMN_VARIANTS = (
+    ('Source url', 'Source URL', 'Source_url', 'source_url'),
+    ('Page ascore', 'Page Ascore', 'Page_ascore', 'page_ascore'),
+    ('External links', 'External Links', 'External_links', 'external_links'),
+    ('Nofollow', 'nofollow', 'No Follow', 'no_follow'),
+)
+
+def resolve_columns(df):
+    """Resolve the column name variations present in a backlink DataFrame"""
+    columns = set(df.columns)
+    return BacklinkColumns(*(
+        next((col for col in variants if col in columns), None)
+        for variants in COLUMN_VARIANTS
+    ))
+
 def process_csv_file(input_file, date_quality_dir, summary_data):
     """Process a CSV backlink file and append to summary data"""
     try:
-        # Skip comparison files
-        if 'comparison' in input_file.lower():
-            debug_log(f"Skipping comparison file: {input_file}")
-            return
-
         debug_log(f"Processing file: {input_file}")
         # Read the input file
         df = pd.read_csv(input_file)
@@ -207,11 +251,7 @@ def process_csv_file(input_file, date_quality_dir, summary_data):
         everything_backlinks = len(df)
         
         # Handle different column name variations
-        source_url_col = None
-        for col in ['Source url', 'Source URL', 'Source_url', 'source_url']:
-            if col in df.columns:
-                source_url_col = col
-                break
+        source_url_col, ascore_col, ext_links_col, nofollow_col = resolve_columns(df)
                 
         if source_url_col is None:
             debug_log(f"Warning: Could not find source URL column in {input_file}")
@@ -219,59 +259,28 @@ def process_csv_file(input_file, date_quality_dir, summary_data):
         else:
             everything_domains = df[source_url_col].nunique()
         
-        # Apply quality filters
-        quality_df = df.copy()
-        
-        # Handle different column name variations for quality filters
-        ascore_col = None
-        for col in ['Page ascore', 'Page Ascore', 'Page_ascore', 'page_ascore']:
-            if col in df.columns:
-                ascore_col = col
-                break
-                
-        ext_links_col = None
-        for col in ['External links', 'External Links', 'External_links', 'external_links']:
-            if col in df.columns:
-                ext_links_col = col
-                break
-                
-        nofollow_col = None
-        for col in ['Nofollow', 'nofollow', 'No Follow', 'no_follow']:
-            if col in df.columns:
-                nofollow_col = col
-                break
+        # Apply quality filters as one combined mask (df itself is never modified,
+        # so there is no need to copy it first)
+        quality_df = df
         
         if ascore_col and ext_links_col:
-            quality_df = quality_df[
-                (quality_df[ascore_col] >= QUALITY_BACKLINK_SETTINGS['MIN_AUTHORITY_SCORE']) &
-                (quality_df[ext_links_col] <= QUALITY_BACKLINK_SETTINGS['MAX_EXTERNAL_LINKS'])
-            ]
+            quality_mask = (df[ascore_col] >= MIN_ASCORE) & (df[ext_links_col] <= MAX_EXT)
+            
+            if nofollow_col and REQ_DOFOLLOW:
+                quality_mask &= ~df[nofollow_col]
             
-            if nofollow_col and QUALITY_BACKLINK_SETTINGS['REQUIRE_DOFOLLOW']:
-                quality_df = quality_df[~quality_df[nofollow_col]]
+            quality_df = df[quality_mask]
         
         # Get one backlink per domain (with least external links)
         if not quality_df.empty and source_url_col and ext_links_col:
-            # Create a list to store unique domains and their best backlinks
-            unique_domains = {}  # Dictionary to store domain -> best backlink mapping
-            
-            # Sort by external links to process lowest first
+            # Sort by external links so the first row per domain has the fewest
             quality_df = quality_df.sort_values(ext_links_col)
-            
-            # Loop through each row
-            for _, row in quality_df.iterrows():
-                # Extract domain from URL
-                source_domain = extract_domain_from_url(row[source_url_col])
-                
-                if source_domain:
-                    # If domain not in list or current row has fewer external links
-                    if source_domain not in unique_domains:
-                        unique_domains[source_domain] = row
-                    elif row[ext_links_col] < unique_domains[source_domain][ext_links_col]:
-                        unique_domains[source_domain] = row
-            
-            # Convert the dictionary back to a DataFrame
-            quality_df = pd.DataFrame(list(unique_domains.values()))
+
+            # Extract each row's domain and keep the first row of each
+            source_domains = quality_df[source_url_col].map(extract_domain_from_url).fillna('')
+            has_domain = source_domains != ''
+            quality_df = quality_df[has_domain]
+            quality_df = quality_df[~source_domains[has_domain].duplicated()]
         
         # Calculate quality metrics
         quality_backlinks = len(quality_df)
@@ -307,6 +316,13 @@ def process_csv_file(input_file, date_quality_dir, summary_data):
         debug_log(f"Error processing file {input_file}: {str(e)}")
         return
 
+def process_csv_file_worker(input_file, date_quality_dir):
+    """Run process_csv_file in a worker process and return its summary rows"""
+    debug_log(f"\nProcessing: {os.path.basename(input_file)}")
+    summary_data = []
+    process_csv_file(input_file, date_quality_dir, summary_data)
+    return summary_data
+
 def main():
     try:
         # Set up argument parser
@@ -331,8 +347,9 @@ def main():
         for directory in [date_quality_dir, summary_dir]:
             ensure_directory_exists(directory)
 
-        # Get all CSV files in the input directory
-        csv_files = glob.glob(os.path.join(input_dir, '*.csv'))
+        # Get all CSV files in the input directory, skipping comparison files
+        csv_files = [p for p in glob.glob(os.path.join(input_dir, '*.csv'))
+                     if 'comparison' not in os.path.basename(p).lower()]
         debug_log(f"Found {len(csv_files)} CSV files to process")
         
         if not csv_files:
@@ -341,10 +358,12 @@ def main():
         
         summary_data = []
         
-        # Process each CSV file
-        for csv_file in csv_files:
-            debug_log(f"\nProcessing: {os.path.basename(csv_file)}")
-            process_csv_file(csv_file, date_quality_dir, summary_data)
+        # Process the CSV files in parallel; each file is independent
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(process_csv_file_worker, csv_files,
+                                   [date_quality_dir] * len(csv_files), chunksize=4)
+            for file_summary in results:
+                summary_data.extend(file_summary)
         
         # Create summary CSV
         if summary_data:
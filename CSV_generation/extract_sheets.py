@@ -4,6 +4,8 @@ from config import DEFAULT_OUTPUT_DIRECTORY, EVERYTHING_QUALITY_DIR, SUMMARY_DIR
 from urllib.parse import urlparse
 import glob
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 # Add debug logging
 def debug_log(message):
@@ -20,6 +22,7 @@ def ensure_directory_exists(directory):
         debug_log(f"Error creating directory {directory}: {str(e)}")
         exit(1)
 
+@lru_cache(maxsize=None)
 def extract_domain_from_url(url):
     """Extract domain name from URL, stopping at first semantic sign"""
     try:
@@ -47,11 +50,6 @@ def extract_domain_from_url(url):
 def process_csv_file(input_file, date_quality_dir, summary_data, leftout_domains):
     """Process a CSV backlink file and append to summary data"""
     try:
-        # Skip comparison files
-        if 'comparison' in input_file.lower():
-            debug_log(f"Skipping comparison file: {input_file}")
-            return
-
         debug_log(f"Processing file: {input_file}")
         # Read the input file
         df = pd.read_csv(input_file)
@@ -113,26 +111,14 @@ def process_csv_file(input_file, date_quality_dir, summary_data, leftout_domains
         
         # Get one backlink per domain (with least external links)
         if not quality_df.empty and source_url_col and ext_links_col:
-            # Create a list to store unique domains and their best backlinks
-            unique_domains = {}  # Dictionary to store domain -> best backlink mapping
-            
-            # Sort by external links to process lowest first
+            # Sort by external links so the first row per domain has the fewest
             quality_df = quality_df.sort_values(ext_links_col)
-            
-            # Loop through each row
-            for _, row in quality_df.iterrows():
-                # Extract domain from URL
-                source_domain = extract_domain_from_url(row[source_url_col])
-                
-                if source_domain:
-                    # If domain not in list or current row has fewer external links
-                    if source_domain not in unique_domains:
-                        unique_domains[source_domain] = row
-                    elif row[ext_links_col] < unique_domains[source_domain][ext_links_col]:
-                        unique_domains[source_domain] = row
-            
-            # Convert the dictionary back to a DataFrame
-            quality_df = pd.DataFrame(list(unique_domains.values()))
+
+            # Extract each row's domain and keep the first row of each
+            source_domains = quality_df[source_url_col].map(extract_domain_from_url).fillna('')
+            has_domain = source_domains != ''
+            quality_df = quality_df[has_domain]
+            quality_df = quality_df[~source_domains[has_domain].duplicated()]
         
         # Calculate quality domains AFTER deduplication (number of unique referring domains)
         quality_domains = quality_df[source_url_col].nunique() if source_url_col and not quality_df.empty else 0
@@ -168,6 +154,14 @@ def process_csv_file(input_file, date_quality_dir, summary_data, leftout_domains
         debug_log(f"Error processing file {input_file}: {str(e)}")
         return
 
+def process_csv_file_worker(input_file, date_quality_dir):
+    """Run process_csv_file in a worker process and return its summary rows and left out domains"""
+    debug_log(f"\nProcessing: {os.path.basename(input_file)}")
+    summary_data = []
+    leftout_domains = []
+    process_csv_file(input_file, date_quality_dir, summary_data, leftout_domains)
+    return summary_data, leftout_domains
+
 def main():
     try:
         # Set up argument parser
@@ -193,8 +187,9 @@ def main():
         for directory in [date_quality_dir, summary_dir, text_files_dir]:
             ensure_directory_exists(directory)
 
-        # Get all CSV files in the input directory
-        csv_files = glob.glob(os.path.join(input_dir, '*.csv'))
+        # Get all CSV files in the input directory, skipping comparison files
+        csv_files = [p for p in glob.glob(os.path.join(input_dir, '*.csv'))
+                     if 'comparison' not in os.path.basename(p).lower()]
         debug_log(f"Found {len(csv_files)} CSV files to process")
         
         if not csv_files:
@@ -204,10 +199,13 @@ def main():
         summary_data = []
         leftout_domains = []
         
-        # Process each CSV file
-        for csv_file in csv_files:
-            debug_log(f"\nProcessing: {os.path.basename(csv_file)}")
-            process_csv_file(csv_file, date_quality_dir, summary_data, leftout_domains)
+        # Process the CSV files in parallel; each file is independent
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(process_csv_file_worker, csv_files,
+                                   [date_quality_dir] * len(csv_files), chunksize=4)
+            for file_summary, file_leftout in results:
+                summary_data.extend(file_summary)
+                leftout_domains.extend(file_leftout)
         
         # Create summary CSV
         if summary_data:
@@ -1,4 +1,5 @@
 import os
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
@@ -39,26 +40,37 @@ def analyze_domains_with_debug(df):
     sample_keyword = 'porn'
     print(f"Sample comparison: '{sample_keyword}' in '{sample_domain}'?", sample_keyword in sample_domain)
 
-    for _, row in df.iterrows():
-        domain = str(row['Name']).lower()
-        matched_keywords = []
-        matched_categories = set()
-        for category, keywords in DODGY_KEYWORDS.items():
-            for word in keywords:
-                if word in domain:
-                    matched_keywords.append(word)
-                    matched_categories.add(category)
-        if matched_keywords:
-            debug_flagged = True
-            print(f"DEBUG: Domain '{domain}' matched keywords: {matched_keywords} (categories: {list(matched_categories)})")
-            unsuitable_domains += 1
-            for category in matched_categories:
-                category_matches[category] += 1
-            detailed_results.append({
-                'domain': domain,
-                'matched_keywords': ', '.join(matched_keywords),
-                'matched_categories': ', '.join(matched_categories)
-            })
+    # Test every keyword against the whole column at once (one C-level scan per
+    # keyword) instead of looping over the rows in Python
+    domains = df['Name'].map(str).str.lower()
+    keyword_categories = [(word, category) for category, keywords in DODGY_KEYWORDS.items() for word in keywords]
+    keyword_hits = np.column_stack(
+        [domains.str.contains(word, regex=False).to_numpy(dtype=bool) for word, _ in keyword_categories]
+    )
+    category_hits = {
+        category: keyword_hits[:, [c == category for _, c in keyword_categories]].any(axis=1)
+        for category in DODGY_KEYWORDS
+    }
+    flagged = keyword_hits.any(axis=1)
+
+    unsuitable_domains = int(flagged.sum())
+    for category, hits in category_hits.items():
+        category_matches[category] += int(hits.sum())
+
+    # Only the flagged rows need their keyword and category lists built; the
+    # flagged names themselves are returned as one array for removal
+    domain_values = domains.to_numpy()
+    for position in np.flatnonzero(flagged):
+        domain = domain_values[position]
+        matched_keywords = [word for (word, _), hit in zip(keyword_categories, keyword_hits[position]) if hit]
+        matched_categories = {category for category, hits in category_hits.items() if hits[position]}
+        debug_flagged = True
+        print(f"DEBUG: Domain '{domain}' matched keywords: {matched_keywords} (categories: {list(matched_categories)})")
+        detailed_results.append({
+            'domain': domain,
+            'matched_keywords': ', '.join(matched_keywords),
+            'matched_categories': ', '.join(matched_categories)
+        })
 
     if not debug_flagged:
         print("\nTROUBLESHOOTING: No domains were flagged as unsuitable.")
@@ -76,7 +88,8 @@ def analyze_domains_with_debug(df):
         'total_domains': total_domains,
         'unsuitable_domains': unsuitable_domains,
         'category_matches': category_matches,
-        'detailed_results': detailed_results
+        'detailed_results': detailed_results,
+        'flagged_domains': domain_values[flagged]
     }
 
 def remove_flagged_domains(latest_file, flagged_domains):
@@ -126,8 +139,7 @@ def main():
     print(f"\nAnalysis complete. Report saved to: {report_file}")
 
     # Remove flagged domains and save cleaned file
-    flagged_domains = [entry['domain'] for entry in results['detailed_results']]
-    remove_flagged_domains(latest_file, flagged_domains)
+    remove_flagged_domains(latest_file, results['flagged_domains'])
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -8,7 +8,7 @@ detecting suspicious keywords, and generating reports.
 
 # Import key functions from modules to expose at package level
 try:
-    from content_analysis.detection import find_keywords_in_text, analyze_content
+    from content_analysis.detection import find_keywords_in_text, analyze_content, analyze_domains
     from content_analysis.reporting import add_content_analysis_sheet, add_dodgy_domain_sheet
     from content_analysis.utils import get_alpha_ordered_domains, categorize_suspicious_content
 except ImportError as e:
@@ -25,6 +25,7 @@ except ImportError as e:
 
     find_keywords_in_text = raise_import_error("find_keywords_in_text")
     analyze_content = raise_import_error("analyze_content")
+    analyze_domains = raise_import_error("analyze_domains")
     add_content_analysis_sheet = raise_import_error("add_content_analysis_sheet")
     add_dodgy_domain_sheet = raise_import_error("add_dodgy_domain_sheet")
     get_alpha_ordered_domains = raise_import_error("get_alpha_ordered_domains")
@@ -35,6 +36,7 @@ __all__ = [
     # Detection functions
     'find_keywords_in_text',
     'analyze_content',
+    'analyze_domains',
 
     # Reporting functions
     'add_content_analysis_sheet',
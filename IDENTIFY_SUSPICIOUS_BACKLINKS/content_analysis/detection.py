@@ -3,6 +3,10 @@
 Functions for detecting suspicious content in backlink data.
 """
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import numpy as np
 import pandas as pd
 
 # Import our keywords
@@ -19,6 +23,73 @@ except ImportError:
     }
 
 
+def _compile_lowered(pattern):
+    """
+    Compile a keyword pattern for searching already lowercased text.
+
+    Lowercase patterns need no IGNORECASE flag there, which lets the regex engine
+    use its faster case-sensitive literal matching.
+    """
+    has_uppercase = re.search(r'[A-Z]', re.sub(r'\\.', '', pattern)) is not None
+    return re.compile(pattern, re.IGNORECASE if has_uppercase else 0)
+
+
+def _alternation(patterns):
+    """Join regex patterns into one alternation string."""
+    return '|'.join(f'(?:{pattern})' for pattern in patterns)
+
+
+def _build_prefilter(all_patterns):
+    """
+    Build a fast check for whether a text can contain any keyword at all.
+
+    The returned callable takes the text and its lowercased copy, and searches
+    the combined regex of all patterns once.
+    """
+    any_keyword = _compile_lowered(_alternation(all_patterns))
+    any_keyword_ignorecase = re.compile(_alternation(all_patterns), re.IGNORECASE)
+
+    def may_contain_keyword(text, lowered):
+        if len(lowered) != len(text):
+            # Lowercasing changed the length, so search the original text instead
+            return any_keyword_ignorecase.search(text) is not None
+        return any_keyword.search(lowered) is not None
+
+    return may_contain_keyword
+
+
+def _compile_keywords(suspicious_keywords):
+    """
+    Compile a {category: [regex, ...]} dictionary for searching.
+
+    Returns:
+        Tuple of (prefilter callable telling whether a text may contain any keyword,
+        {category: [re.Pattern]} for lowercased text,
+        {category: [re.Pattern]} case-insensitive, for text whose length lower() changes)
+    """
+    compiled_lowered = {
+        category: [_compile_lowered(pattern) for pattern in patterns]
+        for category, patterns in suspicious_keywords.items()
+    }
+    compiled_ignorecase = {
+        category: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        for category, patterns in suspicious_keywords.items()
+    }
+    all_patterns = [pattern for patterns in suspicious_keywords.values() for pattern in patterns]
+    return _build_prefilter(all_patterns), compiled_lowered, compiled_ignorecase
+
+
+# The default keywords are compiled once at import rather than on every search
+_COMPILED_KEYWORDS = _compile_keywords(SUSPICIOUS_KEYWORDS)
+
+
+def _get_compiled_keywords(suspicious_keywords=None):
+    """Return compiled patterns, reusing the precompiled defaults where possible."""
+    if suspicious_keywords is None or suspicious_keywords is SUSPICIOUS_KEYWORDS:
+        return _COMPILED_KEYWORDS
+    return _compile_keywords(suspicious_keywords)
+
+
 def find_keywords_in_text(text, suspicious_keywords=None):
     """
     Find suspicious keywords in a text using regex patterns.
@@ -33,15 +104,33 @@ def find_keywords_in_text(text, suspicious_keywords=None):
     if not text or not isinstance(text, str):
         return []
 
-    if suspicious_keywords is None:
-        suspicious_keywords = SUSPICIOUS_KEYWORDS
+    return _find_compiled_keywords(text, _get_compiled_keywords(suspicious_keywords))
+
+
+def _find_compiled_keywords(text, compiled_keywords):
+    """find_keywords_in_text over keywords already compiled by _compile_keywords."""
+    may_contain_keyword, compiled_lowered, compiled_ignorecase = compiled_keywords
+
+    # Most texts contain no keyword at all: one prefilter scan rejects them
+    # before running every pattern separately
+    lowered = text.lower()
+    if not may_contain_keyword(text, lowered):
+        return []
+
+    # Search the lowercased text when its positions line up with the original
+    if len(lowered) == len(text):
+        search_text, compiled = lowered, compiled_lowered
+    else:
+        search_text, compiled = text, compiled_ignorecase
 
     found_matches = []
 
-    for category, patterns in suspicious_keywords.items():
+    # Patterns can overlap (the same word may belong to several categories),
+    # so report the matches of every pattern, not just the leftmost alternative
+    for category, patterns in compiled.items():
         for pattern in patterns:
             # Use regex to find all matches
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(search_text)
             for match in matches:
                 # Get the actual matched text from the source
                 matched_word = text[match.start():match.end()]
@@ -64,23 +153,48 @@ def analyze_content(df, suspicious_keywords=None, domain_name=None):
     Returns:
         DataFrame with flagged content
     """
-    if suspicious_keywords is None:
-        suspicious_keywords = SUSPICIOUS_KEYWORDS
+    # Compile the keyword patterns once for the whole DataFrame
+    compiled_keywords = _get_compiled_keywords(suspicious_keywords)
 
-    # Initialize results
-    results = []
+    # Initialize results, one list per computed output column
+    hit_positions = []
+    flagged_words = []
+    flagged_categories = []
+    amounts = []
+    row_numbers = []
+    locations = []
 
     # Check each column that might contain suspicious content
     columns_to_check = ['Anchor', 'Source title', 'Source url', 'Referring Domain']
-
-    # Process each row
-    for idx, row in df.iterrows():
-        row_number = idx + 1  # +1 because df is 0-indexed but Excel rows start at 1
-        referring_domain = row['Referring Domain'] if 'Referring Domain' in df.columns else "Unknown"
-        source_url = row['Source url'] if 'Source url' in df.columns else ""
-        anchor = row['Anchor'] if 'Anchor' in df.columns else ""
-        source_title = row['Source title'] if 'Source title' in df.columns else ""
-        external_links = row['External links'] if 'External links' in df.columns else None
+    columns_present = [column for column in columns_to_check if column in df.columns]
+
+    # Pre-filter each column as a whole, so only cells that may contain a
+    # keyword are searched pattern by pattern
+    may_contain_keyword = compiled_keywords[0]
+    column_texts = {}
+    column_hits = {}
+    for column in columns_present:
+        texts = df[column].astype(str).where(df[column].notna(), "").tolist()
+        column_texts[column] = texts
+        column_hits[column] = np.fromiter((may_contain_keyword(text, text.lower()) for text in texts),
+                                          dtype=bool, count=len(texts))
+
+    hit_rows = np.zeros(len(df), dtype=bool)
+    for hits in column_hits.values():
+        hit_rows |= hits
+
+    def column_values(column, default):
+        return df[column].to_numpy() if column in df.columns else np.full(len(df), default, dtype=object)
+
+    referring_domains = column_values('Referring Domain', "Unknown")
+    source_urls = column_values('Source url', "")
+    anchors = column_values('Anchor', "")
+    source_titles = column_values('Source title', "")
+    external_links = column_values('External links', None)
+
+    # Process only the rows with a keyword somewhere
+    for position in np.flatnonzero(hit_rows):
+        row_number = df.index[position] + 1  # +1 because df is 0-indexed but Excel rows start at 1
 
         # Container for this row's flagged words
         found_keywords = []
@@ -88,17 +202,12 @@ def analyze_content(df, suspicious_keywords=None, domain_name=None):
         found_locations = []
 
         # Check each column for suspicious content
-        for column in columns_to_check:
-            if column not in df.columns:
-                continue
-
-            text = str(row[column]) if pd.notna(row[column]) else ""
-
-            if not text:
+        for column in columns_present:
+            if not column_hits[column][position]:
                 continue
 
             # Find all keywords in this text
-            matches = find_keywords_in_text(text, suspicious_keywords)
+            matches = _find_compiled_keywords(column_texts[column][position], compiled_keywords)
             for keyword, category, _ in matches:
                 found_keywords.append(keyword)
                 found_categories.add(category)
@@ -106,32 +215,28 @@ def analyze_content(df, suspicious_keywords=None, domain_name=None):
 
         # If we found any suspicious keywords, add to results
         if found_keywords:
-            results.append({
-                'Domain': domain_name,
-                'Referring Domain': referring_domain,
-                'Flagged Word(s)': ', '.join(found_keywords),
-                'Categories': ', '.join(found_categories),
-                'Amount': len(found_keywords),
-                'Row Number': row_number,
-                'Source URL': source_url,
-                'Anchor': anchor,
-                'Title': source_title,
-                'External Links': external_links,
-                'Location': ', '.join(found_locations)
-            })
-
-    # Convert to DataFrame
-    if results:
-        results_df = pd.DataFrame(results)
-        # Reorder columns as requested
-        column_order = ['Domain', 'Flagged Word(s)', 'Categories', 'Amount',
-                        'Source URL', 'Anchor', 'Title', 'Referring Domain',
-                        'External Links', 'Location', 'Row Number']
-        # Ensure all columns exist
-        for col in column_order:
-            if col not in results_df.columns:
-                results_df[col] = ""
-        return results_df[column_order]
+            hit_positions.append(position)
+            flagged_words.append(', '.join(found_keywords))
+            flagged_categories.append(', '.join(found_categories))
+            amounts.append(len(found_keywords))
+            row_numbers.append(row_number)
+            locations.append(', '.join(found_locations))
+
+    # Convert to DataFrame, built column by column in the requested order
+    if hit_positions:
+        return pd.DataFrame({
+            'Domain': [domain_name] * len(hit_positions),
+            'Flagged Word(s)': flagged_words,
+            'Categories': flagged_categories,
+            'Amount': amounts,
+            'Source URL': source_urls[hit_positions],
+            'Anchor': anchors[hit_positions],
+            'Title': source_titles[hit_positions],
+            'Referring Domain': referring_domains[hit_positions],
+            'External Links': external_links[hit_positions],
+            'Location': locations,
+            'Row Number': row_numbers
+        })
     else:
         # Return empty DataFrame with the correct columns
         return pd.DataFrame(columns=['Domain', 'Flagged Word(s)', 'Categories', 'Amount',
@@ -139,6 +244,31 @@ def analyze_content(df, suspicious_keywords=None, domain_name=None):
                                      'External Links', 'Location', 'Row Number'])
 
 
+def analyze_domains(domain_data_dict, max_workers=None):
+    """
+    Analyze the content of every domain once, so reports can share the results.
+
+    Domains are independent, so they are analyzed in parallel worker processes.
+
+    Args:
+        domain_data_dict: Dictionary mapping domain names to their dataframes
+        max_workers: Maximum number of worker processes (default: CPU count)
+
+    Returns:
+        Dictionary mapping domain names to their analyze_content results
+        (empty dataframes are skipped)
+    """
+    domains = [domain for domain, df in domain_data_dict.items() if df is not None and not df.empty]
+    frames = [domain_data_dict[domain] for domain in domains]
+
+    if len(domains) <= 1:
+        return {domain: analyze_content(df, domain_name=domain) for domain, df in zip(domains, frames)}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(analyze_content, frames, repeat(None), domains)
+        return dict(zip(domains, results))
+
+
 def get_suspicious_ratio(df, domain_name=None):
     """
     Calculate the ratio of suspicious content in a DataFrame.
@@ -188,34 +318,13 @@ def highlight_suspicious_words_in_text(text, keywords):
     if not text or not keywords:
         return text
 
-    result = text
-    # Convert to lowercase for case-insensitive matching
-    text_lower = text.lower()
-
-    # Process each keyword and mark it
-    for keyword in keywords:
-        keyword_lower = keyword.lower()
-        if keyword_lower in text_lower:
-            # Find all occurrences of the keyword
-            start_idx = 0
-            while True:
-                idx = text_lower.find(keyword_lower, start_idx)
-                if idx == -1:
-                    break
-
-                # Extract the actual case-sensitive version of the keyword from original text
-                actual_keyword = text[idx:idx + len(keyword)]
-
-                # Mark it with special tags (can be later interpreted by Excel formatting)
-                marked_keyword = f"<mark>{actual_keyword}</mark>"
-
-                # Replace in the result
-                result = result[:idx] + marked_keyword + result[idx + len(keyword):]
-
-                # Update search start position and adjust for the inserted tags
-                start_idx = idx + len(marked_keyword)
+    # Mark every occurrence in a single pass, keeping the original casing
+    pattern = _keyword_highlight_pattern(tuple(keywords))
+    return pattern.sub(lambda match: f"<mark>{match.group(0)}</mark>", text)
 
-                # Also update lowercase text for future searches
-                text_lower = text_lower[:idx] + " " * len(keyword) + text_lower[idx + len(keyword):]
 
-    return result
\ No newline at end of file
+@lru_cache(maxsize=128)
+def _keyword_highlight_pattern(keywords):
+    """Compile a case-insensitive alternation of literal keywords (longest first)."""
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(keyword) for keyword in ordered), re.IGNORECASE)
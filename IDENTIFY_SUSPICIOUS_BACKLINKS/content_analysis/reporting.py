@@ -2,6 +2,9 @@
 """
 Functions for generating reports and Excel sheets for suspicious content analysis.
 """
+import logging
+from collections import Counter
+from functools import lru_cache
 import pandas as pd
 from openpyxl.styles import PatternFill, Font, Alignment
 from openpyxl.utils import get_column_letter
@@ -38,9 +41,19 @@ from core.utils import sanitize_sheet_name
 
 # Import from our own modules
 from content_analysis.utils import get_alpha_ordered_domains
-from content_analysis.detection import analyze_content
+from content_analysis.detection import analyze_content, analyze_domains
 
+logger = logging.getLogger(__name__)
 
+
+def _get_domain_results(df, domain, analysis_results=None):
+    """Return a domain's analyze_content results, reusing precomputed ones when given."""
+    if analysis_results is not None and domain in analysis_results:
+        return analysis_results[domain]
+    return analyze_content(df, domain_name=domain)
+
+
+@lru_cache(maxsize=1024)
 def create_valid_sheet_name(domain_name, suffix):
     """
     Create a valid Excel sheet name (max 31 chars) from a domain name and suffix.
@@ -66,7 +79,8 @@ def create_valid_sheet_name(domain_name, suffix):
     return base_name
 
 
-def add_dodgy_domain_sheet(workbook, domain_name, dodgy_data, domain_everything_df=None, sheet_number=None):
+def add_dodgy_domain_sheet(workbook, domain_name, dodgy_data, domain_everything_df=None, sheet_number=None,
+                           domain_names=None):
     """
     Add a domain-specific sheet for dodgy keywords with improved formatting and navigation.
     Filters out backlinks with external links > 5000.
@@ -75,8 +89,11 @@ def add_dodgy_domain_sheet(workbook, domain_name, dodgy_data, domain_everything_
         workbook: The openpyxl workbook
         domain_name: The domain name for this sheet
         dodgy_data: DataFrame with dodgy keyword data
-        domain_everything_df: Optional original DataFrame to get External Links values
+        domain_everything_df: Deprecated and ignored; dodgy_data already has the
+            External Links values. Kept so positional callers still line up
         sheet_number: The sheet number for this domain
+        domain_names: Optional alphabetically ordered domain list for navigation
+            (read from the workbook's sheet names when not given)
 
     Returns:
         The created worksheet
@@ -86,16 +103,19 @@ def add_dodgy_domain_sheet(workbook, domain_name, dodgy_data, domain_everything_
 
     # Create the sheet
     try:
-        print(f"\nDebug - {domain_name} dodgy data columns before processing:")
-        print(dodgy_data.columns.tolist())
+        logger.debug("%s dodgy data columns before processing: %s", domain_name, dodgy_data.columns)
 
         # Filter out backlinks with external links > 5000
         if 'External Links' in dodgy_data.columns:
             original_count = len(dodgy_data)
-            dodgy_data = dodgy_data[dodgy_data['External Links'].astype(float) <= 5000]
+            # Non-numeric placeholders become NaN (and are filtered like missing values)
+            # instead of making astype(float) raise
+            external_links = pd.to_numeric(dodgy_data['External Links'], errors='coerce')
+            dodgy_data = dodgy_data[external_links <= 5000]
             filtered_count = len(dodgy_data)
-            print(f"\nDebug - {domain_name}: Filtered out {original_count - filtered_count} backlinks with > 5000 external links")
-            print(f"Debug - {domain_name}: Remaining suspicious backlinks: {filtered_count}")
+            logger.debug("%s: Filtered out %d backlinks with > 5000 external links",
+                         domain_name, original_count - filtered_count)
+            logger.debug("%s: Remaining suspicious backlinks: %d", domain_name, filtered_count)
 
         dodgy_sheet = workbook.create_sheet(title=sheet_name)
 
@@ -103,7 +123,8 @@ def add_dodgy_domain_sheet(workbook, domain_name, dodgy_data, domain_everything_
         add_navigation_links(dodgy_sheet, "Summary", 1, 1)
 
         # Get all domain names in the workbook (for navigation)
-        domain_names = get_alpha_ordered_domains(workbook)
+        if domain_names is None:
+            domain_names = get_alpha_ordered_domains(workbook)
 
         # Find the current domain position in alphabetical order
         current_idx = -1
@@ -144,45 +165,9 @@ def add_dodgy_domain_sheet(workbook, domain_name, dodgy_data, domain_everything_
 
         # Add content if we have dodgy data
         if not dodgy_data.empty:
-            print(f"\nDebug - {domain_name} dodgy data columns after navigation:")
-            print(dodgy_data.columns.tolist())
-
-            # Add External Links column from the everything data if available
-            if domain_everything_df is not None and 'External links' in domain_everything_df.columns:
-                # Create a mapping from Source URL to External links count
-                url_to_external_links = {}
-                source_url_col = 'Source url' if 'Source url' in domain_everything_df.columns else 'Source URL'
-
-                if source_url_col in domain_everything_df.columns:
-                    for _, row in domain_everything_df.iterrows():
-                        url = str(row[source_url_col])
-                        if 'External links' in row:
-                            url_to_external_links[url] = row['External links']
-
-                    print(f"\nDebug - {domain_name} url_to_external_links mapping created with {len(url_to_external_links)} entries")
-
-                # Add External Links column to dodgy_data if it doesn't exist
-                if 'External Links' not in dodgy_data.columns:
-                    external_links = []
-                    source_url_col = 'Source URL' if 'Source URL' in dodgy_data.columns else 'Source url'
-
-                    if source_url_col in dodgy_data.columns:
-                        for _, row in dodgy_data.iterrows():
-                            url = str(row[source_url_col])
-                            external_links.append(url_to_external_links.get(url, ""))
-
-                        print(f"\nDebug - {domain_name} external_links list created with {len(external_links)} entries")
-
-                        # Insert after Flagged Word(s) column if it exists
-                        if 'Flagged Word(s)' in dodgy_data.columns:
-                            flagged_idx = dodgy_data.columns.get_loc('Flagged Word(s)')
-                            dodgy_data.insert(flagged_idx + 1, 'External Links', external_links)
-                        else:
-                            # Otherwise add at the end
-                            dodgy_data['External Links'] = external_links
-
-            print(f"\nDebug - {domain_name} dodgy data columns before reordering:")
-            print(dodgy_data.columns.tolist())
+            logger.debug("%s dodgy data columns after navigation: %s", domain_name, dodgy_data.columns)
+
+            logger.debug("%s dodgy data columns before reordering: %s", domain_name, dodgy_data.columns)
 
             # Ensure columns are in the correct order
             column_order = [
@@ -196,19 +181,10 @@ def add_dodgy_domain_sheet(workbook, domain_name, dodgy_data, domain_everything_
                 'Location'
             ]
             
-            # Add any missing columns with empty values
-            for col in column_order:
-                if col not in dodgy_data.columns:
-                    dodgy_data[col] = ""
-
-            print(f"\nDebug - {domain_name} dodgy data columns after adding missing:")
-            print(dodgy_data.columns.tolist())
-
-            # Reorder columns
-            dodgy_data = dodgy_data[column_order]
+            # Reorder columns, adding any missing ones with empty values in the same step
+            dodgy_data = dodgy_data.reindex(columns=column_order, fill_value="")
 
-            print(f"\nDebug - {domain_name} dodgy data columns after reordering:")
-            print(dodgy_data.columns.tolist())
+            logger.debug("%s dodgy data columns after reordering: %s", domain_name, dodgy_data.columns)
 
             # Add the dataframe
             start_row = 3
@@ -276,55 +252,44 @@ def highlight_suspicious_content(worksheet, start_row, df, flagged_words_col, ca
     if flagged_words_col not in df.columns or locations_col not in df.columns:
         return 0
 
-    # Map column names to their indices in the worksheet
-    col_indices = {}
-    for col_idx in range(1, worksheet.max_column + 1):
-        header_value = worksheet.cell(row=start_row, column=col_idx).value
-        if header_value:
-            col_indices[header_value] = col_idx
+    # Map column names to their indices in the worksheet (one pass over the header row)
+    col_indices = {cell.value: cell.column for cell in worksheet[start_row] if cell.value}
 
-    # Process each row in the dataframe
-    for row_idx, row in enumerate(df.itertuples(), 1):
+    # Walk the two needed columns directly instead of building a namedtuple per row
+    rows = zip(df[flagged_words_col].to_numpy(), df[locations_col].to_numpy())
+    for row_idx, (flagged_words, locations) in enumerate(rows, 1):
         # Skip header row
         if row_idx == 1:
             continue
 
-        # Extract flagged words and locations
-        flagged_words_attr = flagged_words_col.replace(' ', '_')
-        locations_attr = locations_col.replace(' ', '_')
-
-        if hasattr(row, flagged_words_attr) and hasattr(row, locations_attr):
-            flagged_words = getattr(row, flagged_words_attr)
-            locations = getattr(row, locations_attr)
-
-            if pd.isna(flagged_words) or pd.isna(locations):
-                continue
+        if pd.isna(flagged_words) or pd.isna(locations):
+            continue
 
-            # Split into lists
-            word_list = [w.strip().lower() for w in str(flagged_words).split(',')]
-            location_list = [l.strip() for l in str(locations).split(',')]
+        # Split into lists
+        word_list = [w.strip().lower() for w in str(flagged_words).split(',')]
+        location_list = [l.strip() for l in str(locations).split(',')]
 
-            # Get the worksheet row number (header + data row offset)
-            ws_row = start_row + row_idx
+        # Get the worksheet row number (header + data row offset)
+        ws_row = start_row + row_idx
 
-            # For each mentioned location, check and highlight the cell
-            for location in location_list:
-                if location in col_indices:
-                    col_idx = col_indices[location]
-                    cell = worksheet.cell(row=ws_row, column=col_idx)
+        # For each mentioned location, check and highlight the cell
+        for location in location_list:
+            if location in col_indices:
+                col_idx = col_indices[location]
+                cell = worksheet.cell(row=ws_row, column=col_idx)
 
-                    if cell.value:
-                        cell_text = str(cell.value).lower()
+                if cell.value:
+                    cell_text = str(cell.value).lower()
 
-                        # Check if any flagged word is in this cell
-                        if any(word in cell_text for word in word_list):
-                            cell.font = Font(color="FF0000", bold=True)
-                            highlighted_count += 1
+                    # Check if any flagged word is in this cell
+                    if any(word in cell_text for word in word_list):
+                        cell.font = Font(color="FF0000", bold=True)
+                        highlighted_count += 1
 
     return highlighted_count
 
 
-def add_content_analysis_sheet(workbook, domain_data_dict, domain_to_sheet_number):
+def add_content_analysis_sheet(workbook, domain_data_dict, domain_to_sheet_number, analysis_results=None):
     """
     Add a content analysis sheet to the workbook based on all domain data.
 
@@ -332,6 +297,7 @@ def add_content_analysis_sheet(workbook, domain_data_dict, domain_to_sheet_numbe
         workbook: The openpyxl workbook
         domain_data_dict: Dictionary mapping domain names to their dataframes
         domain_to_sheet_number: Dictionary mapping domains to their sheet numbers
+        analysis_results: Optional results of analyze_domains, to avoid re-analyzing
 
     Returns:
         A tuple containing (content_analysis_sheet, domain_dodgy_count_dict, domain_dodgy_domains_dict)
@@ -352,6 +318,14 @@ def add_content_analysis_sheet(workbook, domain_data_dict, domain_to_sheet_numbe
     domain_dodgy_count_dict = {}
     domain_dodgy_domains_dict = {}
 
+    # Analyze all domains with sheets up front (in parallel); the workbook
+    # itself is only written from this process
+    if analysis_results is None:
+        analysis_results = analyze_domains({
+            domain: df for domain, df in domain_data_dict.items()
+            if domain_to_sheet_number.get(domain) is not None
+        })
+
     # Process each domain
     all_results = []
 
@@ -369,11 +343,12 @@ def add_content_analysis_sheet(workbook, domain_data_dict, domain_to_sheet_numbe
         print(f"Analyzing content for domain: {domain}")
 
         # Analyze content
-        domain_results = analyze_content(df, domain_name=domain)
+        domain_results = _get_domain_results(df, domain, analysis_results)
 
         # If dodgy keywords found, create a domain-specific dodgy sheet
         if not domain_results.empty:
-            add_dodgy_domain_sheet(workbook, domain, domain_results, df, sheet_number)
+            add_dodgy_domain_sheet(workbook, domain, domain_results, sheet_number=sheet_number,
+                                   domain_names=domain_names)
 
             # Count the number of dodgy backlinks
             dodgy_count = len(domain_results)
@@ -405,50 +380,51 @@ def add_content_analysis_sheet(workbook, domain_data_dict, domain_to_sheet_numbe
             title="Detected Suspicious Content"
         )
 
-        # Modify cell formatting to make flagged words red and bold
+        # Resolve column positions, sheet names and styles once for all rows
         flagged_col_idx = combined_results.columns.get_loc('Flagged Word(s)') + 1
-        for row_idx in range(4, 4 + len(combined_results)):
+        amount_col_idx = combined_results.columns.get_loc('Amount') + 1
+        domain_col_idx = combined_results.columns.get_loc('Domain') + 1
+        source_url_col_idx = combined_results.columns.get_loc('Source URL') + 1
+        column_count = len(combined_results.columns)
+        sheet_names = set(workbook.sheetnames)
+
+        flagged_font = Font(color="FF0000", bold=True)
+        link_font = Font(color="0000FF", underline="single")
+        multiple_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
+
+        # Format every result row in a single pass
+        for row_cells in content_sheet.iter_rows(min_row=4, max_row=3 + len(combined_results),
+                                                 min_col=1, max_col=column_count):
             # Make the flagged words cell red and bold
-            cell = content_sheet.cell(row=row_idx, column=flagged_col_idx)
-            cell.font = Font(color="FF0000", bold=True)
+            row_cells[flagged_col_idx - 1].font = flagged_font
 
             # Apply light red background to rows with Amount > 1
-            amount_col_idx = combined_results.columns.get_loc('Amount') + 1
-            amount_cell = content_sheet.cell(row=row_idx, column=amount_col_idx)
-
+            amount_cell = row_cells[amount_col_idx - 1]
             try:
                 if amount_cell.value and int(str(amount_cell.value)) > 1:
                     # Apply light red fill to the entire row
-                    for col_idx in range(1, len(combined_results.columns) + 1):
-                        content_sheet.cell(row=row_idx, column=col_idx).fill = PatternFill(
-                            start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
+                    for cell in row_cells:
+                        cell.fill = multiple_fill
             except (ValueError, TypeError):
                 # Skip if amount isn't a valid number
                 pass
 
-        # Add hyperlinks from domain names to their dodgy sheets
-        domain_col_idx = combined_results.columns.get_loc('Domain') + 1
-        for row_idx in range(4, 4 + len(combined_results)):
-            domain_cell = content_sheet.cell(row=row_idx, column=domain_col_idx)
+            # Add hyperlinks from domain names to their dodgy sheets
+            domain_cell = row_cells[domain_col_idx - 1]
             domain_name = domain_cell.value
-
-            # Create the hyperlink to the dodgy sheet
             if domain_name:
                 dodgy_sheet_name = f"{domain_name}-backlinks_dodgy"
 
-                if dodgy_sheet_name in workbook.sheetnames:
+                if dodgy_sheet_name in sheet_names:
                     domain_cell.hyperlink = f"#{dodgy_sheet_name}!A1"
-                    domain_cell.font = Font(color="0000FF", underline="single")
+                    domain_cell.font = link_font
 
-        # Add hyperlinks to source URLs
-        source_url_col_idx = combined_results.columns.get_loc('Source URL') + 1
-        for row_idx in range(4, 4 + len(combined_results)):
-            url_cell = content_sheet.cell(row=row_idx, column=source_url_col_idx)
+            # Add hyperlinks to source URLs
+            url_cell = row_cells[source_url_col_idx - 1]
             url = url_cell.value
-
             if url and isinstance(url, str) and url.startswith('http'):
                 url_cell.hyperlink = url
-                url_cell.font = Font(color="0000FF", underline="single")
+                url_cell.font = link_font
 
         # Auto-adjust for better fit
         auto_adjust_cells(
@@ -470,13 +446,14 @@ def add_content_analysis_sheet(workbook, domain_data_dict, domain_to_sheet_numbe
     return content_sheet, domain_dodgy_count_dict, domain_dodgy_domains_dict
 
 
-def create_suspicious_summary_report(workbook, domain_data_dict):
+def create_suspicious_summary_report(workbook, domain_data_dict, analysis_results=None):
     """
     Create a comprehensive summary report of suspicious content across all domains.
 
     Args:
         workbook: The openpyxl workbook
         domain_data_dict: Dictionary mapping domain names to their dataframes
+        analysis_results: Optional results of analyze_domains, to avoid re-analyzing
 
     Returns:
         DataFrame with suspicious content summary
@@ -495,7 +472,7 @@ def create_suspicious_summary_report(workbook, domain_data_dict):
             continue
 
         # Get suspicious content
-        suspicious_df = analyze_content(df, domain_name=domain)
+        suspicious_df = _get_domain_results(df, domain, analysis_results)
 
         # Calculate metrics
         total_backlinks = len(df)
@@ -505,16 +482,15 @@ def create_suspicious_summary_report(workbook, domain_data_dict):
         total_domains = df['Referring Domain'].nunique() if 'Referring Domain' in df.columns else 0
         suspicious_domains = suspicious_df['Referring Domain'].nunique() if not suspicious_df.empty else 0
 
-        # Get category breakdown
-        category_counts = {}
+        # Get category breakdown: rows share a handful of category combinations,
+        # so split each distinct combination once and weight it by its row count
+        category_counts = Counter()
         if not suspicious_df.empty and 'Categories' in suspicious_df.columns:
-            all_categories = []
-            for categories in suspicious_df['Categories']:
+            combination_counts = suspicious_df['Categories'].value_counts(sort=False)
+            for categories, count in combination_counts.items():
                 if isinstance(categories, str):
-                    all_categories.extend([cat.strip() for cat in categories.split(',')])
-
-            for cat in all_categories:
-                category_counts[cat] = category_counts.get(cat, 0) + 1
+                    for cat in categories.split(','):
+                        category_counts[cat.strip()] += count
 
         # Add to summary data
         summary_data.append({
@@ -5,8 +5,64 @@ Core file operations for reading and processing backlink files.
 import pandas as pd
 import logging
 
+# pyarrow is optional; its multithreaded CSV parser is much faster on large exports
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# python-calamine is optional; it reads .xlsx files much faster than openpyxl
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
 logger = logging.getLogger(__name__)
 
+# Date columns are kept as text, as the default parser reads them (pyarrow
+# would otherwise turn them into timestamps)
+TEXT_DATE_COLUMNS = ['First seen', 'Last seen', 'First Seen', 'Last Seen', 'FirstSeen', 'LastSeen']
+
+
+def read_csv_file(file_path, chunksize=None):
+    """
+    Read a CSV file, with the pyarrow engine when it is installed.
+
+    Args:
+        file_path: Path to the CSV file
+        chunksize: If given, read the file in chunks of at most this many rows
+            (with the default parser, as pyarrow cannot read in chunks)
+
+    Returns:
+        DataFrame with the file contents, or a reader yielding DataFrames when
+        chunksize is given
+    """
+    text_date_dtypes = {column: str for column in TEXT_DATE_COLUMNS}
+    if chunksize is not None:
+        return pd.read_csv(file_path, chunksize=chunksize, dtype=text_date_dtypes)
+    if pyarrow is not None:
+        try:
+            return pd.read_csv(file_path, engine='pyarrow', dtype=text_date_dtypes)
+        except (pyarrow.ArrowException, ValueError) as e:
+            logger.debug(f"pyarrow could not parse {file_path}, using the default parser: {e}")
+    return pd.read_csv(file_path)
+
+
+def read_excel_file(file_path):
+    """
+    Read an Excel file, with the calamine engine when it is installed.
+
+    Args:
+        file_path: Path to the Excel file
+
+    Returns:
+        DataFrame with the first sheet's contents
+    """
+    if python_calamine is not None:
+        return pd.read_excel(file_path, engine='calamine')
+    return pd.read_excel(file_path)
+
+
 def read_backlink_file(file_path):
     """
     Read a backlink file (CSV or Excel) and perform initial processing.
@@ -20,16 +76,12 @@ def read_backlink_file(file_path):
     try:
         # Read the file based on extension
         if file_path.lower().endswith('.csv'):
-            df = pd.read_csv(file_path)
+            df = read_csv_file(file_path)
         else:
-            df = pd.read_excel(file_path)
+            df = read_excel_file(file_path)
 
         logger.info(f"Loaded data with {len(df)} rows from {file_path}")
 
-        # Remove any translation-related columns
-        from utils import remove_translation_references
-        df = remove_translation_references(df)
-
         return df
     except Exception as e:
         logger.error(f"Error reading file {file_path}: {e}")
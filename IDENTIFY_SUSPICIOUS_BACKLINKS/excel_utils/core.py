@@ -2,7 +2,7 @@
 """
 Core Excel workbook creation and manipulation utilities.
 """
-import random
+import itertools
 import traceback
 from openpyxl import Workbook
 from openpyxl.worksheet.table import Table, TableStyleInfo
@@ -33,6 +33,21 @@ except ImportError:
         'ROTATING_DOMAIN_COLORS': True
     }
 
+# Suffixes that keep every table name created in this process unique
+_TABLE_SEQ = itertools.count(1)
+
+# Sheet name suffixes (after the first "_") of the per-domain sheets
+_DOMAIN_SHEET_SUFFIXES = frozenset(['Everything', 'Quality', 'dodgy'])
+
+# Style for tables in the default table style, shared by all of them
+_DEFAULT_TABLE_STYLE = TableStyleInfo(
+    name="TableStyleMedium9",
+    showFirstColumn=False,
+    showLastColumn=False,
+    showRowStripes=True,
+    showColumnStripes=False
+)
+
 
 def create_workbook():
     """
@@ -66,18 +81,21 @@ def create_table(worksheet, data_range, table_name, table_style="TableStyleMediu
             clean_table_name = clean_table_name[:250]
 
         # Add a unique identifier to avoid duplicate table names
-        clean_table_name = f"{clean_table_name}_{random.randint(1000, 9999)}"
+        clean_table_name = f"{clean_table_name}_{next(_TABLE_SEQ)}"
 
         print(f"Creating table: {clean_table_name} with range {data_range}")
 
         table = Table(displayName=clean_table_name, ref=data_range)
-        style = TableStyleInfo(
-            name=table_style,
-            showFirstColumn=False,
-            showLastColumn=False,
-            showRowStripes=True,
-            showColumnStripes=False
-        )
+        if table_style == _DEFAULT_TABLE_STYLE.name:
+            style = _DEFAULT_TABLE_STYLE
+        else:
+            style = TableStyleInfo(
+                name=table_style,
+                showFirstColumn=False,
+                showLastColumn=False,
+                showRowStripes=True,
+                showColumnStripes=False
+            )
         table.tableStyleInfo = style
 
         # Add the table to the worksheet
@@ -104,33 +122,46 @@ def auto_adjust_cells(worksheet, start_row, start_col, end_row, end_col, min_wid
         max_width: Maximum column width
         adjust_height: Whether to adjust row height
     """
-    # Adjust column widths
-    for col_idx in range(start_col, end_col + 1):
-        col_letter = get_column_letter(col_idx)
-        max_length = 0
-
-        # Check a sample of values in the column (up to 100 rows)
-        for row_idx in range(start_row, min(end_row + 1, start_row + 100)):
-            cell = worksheet.cell(row=row_idx, column=col_idx)
-            if cell.value:
-                cell_text = str(cell.value)
+    if end_col < start_col:
+        return
+
+    # Longest line per column and line count per row, gathered in a single pass
+    # over a sample of the rows (up to 100)
+    max_lengths = [0] * (end_col - start_col + 1)
+    row_lines = {}
+    sample_end_row = min(end_row, start_row + 99)
+    sample_rows = worksheet.iter_rows(min_row=start_row, max_row=sample_end_row,
+                                      min_col=start_col, max_col=end_col,
+                                      values_only=True) if sample_end_row >= start_row else ()
+    for row_idx, row_values in enumerate(sample_rows, start_row):
+        for position, value in enumerate(row_values):
+            if not value:
+                continue
+            cell_text = str(value)
+            if '\n' not in cell_text:
+                max_line_length = len(cell_text)
+            else:
                 # Count newlines for height adjustment
-                cell_lines = cell_text.count('\n') + 1
-                # Get maximum line length for width
-                max_line_length = max(len(line) for line in cell_text.split('\n'))
-                max_length = max(max_length, max_line_length)
-
-                # Adjust row height if needed and enabled
-                if adjust_height and cell_lines > 1:
-                    current_height = worksheet.row_dimensions[row_idx].height
-                    if current_height is None:
-                        current_height = 15  # Default row height
-                    needed_height = cell_lines * 15  # Approximately 15 points per line
-                    worksheet.row_dimensions[row_idx].height = max(current_height, needed_height)
-
-        # Set column width with padding, bounded by min/max
+                lines = cell_text.split('\n')
+                row_lines[row_idx] = max(row_lines.get(row_idx, 1), len(lines))
+                max_line_length = max(len(line) for line in lines)
+            # Get maximum line length for width
+            if max_line_length > max_lengths[position]:
+                max_lengths[position] = max_line_length
+
+    # Adjust row height if needed and enabled
+    if adjust_height:
+        for row_idx, cell_lines in row_lines.items():
+            current_height = worksheet.row_dimensions[row_idx].height
+            if current_height is None:
+                current_height = 15  # Default row height
+            needed_height = cell_lines * 15  # Approximately 15 points per line
+            worksheet.row_dimensions[row_idx].height = max(current_height, needed_height)
+
+    # Set column width with padding, bounded by min/max
+    for col_idx, max_length in enumerate(max_lengths, start_col):
         adjusted_width = max(min_width, min(max_length + 3, max_width))
-        worksheet.column_dimensions[col_letter].width = adjusted_width
+        worksheet.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
 
 
 def get_alpha_ordered_domains(workbook):
@@ -147,15 +178,35 @@ def get_alpha_ordered_domains(workbook):
     domains = set()
     for sheet_name in workbook.sheetnames:
         # Try to extract domain from sheet name (assuming format like domain_Everything)
-        parts = sheet_name.split('_')
-        if len(parts) >= 2 and parts[1] in ['Everything', 'Quality', 'dodgy']:
-            domains.add(parts[0])
+        domain, separator, rest = sheet_name.partition('_')
+        if separator and rest.partition('_')[0] in _DOMAIN_SHEET_SUFFIXES:
+            domains.add(domain)
 
     # Sort alphabetically
-    return sorted(list(domains))
+    return sorted(domains)
+
+
+def build_header_map(worksheet, header_row):
+    """
+    Map each header name in a row to its column index, reading the row once.
+
+    Args:
+        worksheet: The openpyxl worksheet
+        header_row: Row where headers are located
+
+    Returns:
+        Dictionary of header value to column index (1-based); the first column
+        wins when a header repeats
+    """
+    headers = next(worksheet.iter_rows(min_row=header_row, max_row=header_row,
+                                       max_col=worksheet.max_column, values_only=True))
+    header_map = {}
+    for col_idx, cell_value in enumerate(headers, 1):
+        header_map.setdefault(cell_value, col_idx)
+    return header_map
 
 
-def find_column_index(worksheet, header_row, column_name):
+def find_column_index(worksheet, header_row, column_name, header_map=None):
     """
     Find the index of a column by its header name.
 
@@ -163,12 +214,11 @@ def find_column_index(worksheet, header_row, column_name):
         worksheet: The openpyxl worksheet
         header_row: Row where headers are located
         column_name: Name of the column to find
+        header_map: Result of build_header_map for this row, to reuse across lookups
 
     Returns:
         Column index (1-based) or None if not found
     """
-    for col_idx in range(1, worksheet.max_column + 1):
-        cell_value = worksheet.cell(row=header_row, column=col_idx).value
-        if cell_value == column_name:
-            return col_idx
-    return None
\ No newline at end of file
+    if header_map is None:
+        header_map = build_header_map(worksheet, header_row)
+    return header_map.get(column_name)
@@ -2,39 +2,62 @@
 Summary utilities for Excel workbooks.
 """
 
+import itertools
+
 import pandas as pd
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
 
-def add_summary_to_sheet(workbook, sheet_name, summary_data):
+# Shared by every summary instead of new style objects per write
+_TITLE_FONT = Font(bold=True, size=14)
+_SUMMARY_ALIGNMENT = Alignment(horizontal='left', vertical='center')
+
+
+def _add_key_value_summary(worksheet, title, data):
     """
-    Add a summary to a worksheet.
-    
+    Write a title and one key/value pair per row (from row 3) to a worksheet.
+
+    Values and alignment are set in a single pass over the summary range.
+
     Args:
-        workbook: The workbook to add the summary to
-        sheet_name: The name of the sheet to add the summary to
-        summary_data: Dictionary containing summary data
+        worksheet: The openpyxl worksheet
+        title: Title to display in cell A1
+        data: Dictionary of summary keys and values
     """
-    worksheet = workbook[sheet_name]
-    
     # Add title
     title_cell = worksheet.cell(row=1, column=1)
-    title_cell.value = "Summary"
-    title_cell.font = Font(bold=True, size=14)
-    
+    title_cell.value = title
+    title_cell.font = _TITLE_FONT
+
+    rows = worksheet.iter_rows(min_row=1, max_row=2 + len(data), min_col=1, max_col=2)
+
+    # Title and spacer rows only need the alignment
+    for row_cells in itertools.islice(rows, 2):
+        for cell in row_cells:
+            cell.alignment = _SUMMARY_ALIGNMENT
+
     # Add summary data
-    row = 3
-    for key, value in summary_data.items():
-        worksheet.cell(row=row, column=1, value=key)
-        worksheet.cell(row=row, column=2, value=value)
-        row += 1
-    
+    for (key_cell, value_cell), (key, value) in zip(rows, data.items()):
+        key_cell.value = key
+        value_cell.value = value
+        key_cell.alignment = _SUMMARY_ALIGNMENT
+        value_cell.alignment = _SUMMARY_ALIGNMENT
+
     # Format the summary
     for col in range(1, 3):
         worksheet.column_dimensions[get_column_letter(col)].width = 20
-        for row in range(1, row):
-            cell = worksheet.cell(row=row, column=col)
-            cell.alignment = Alignment(horizontal='left', vertical='center')
+
+
+def add_summary_to_sheet(workbook, sheet_name, summary_data):
+    """
+    Add a summary to a worksheet.
+    
+    Args:
+        workbook: The workbook to add the summary to
+        sheet_name: The name of the sheet to add the summary to
+        summary_data: Dictionary containing summary data
+    """
+    _add_key_value_summary(workbook[sheet_name], "Summary", summary_data)
 
 def add_suspicious_content_summary(workbook, sheet_name, suspicious_data):
     """
@@ -45,23 +68,4 @@ def add_suspicious_content_summary(workbook, sheet_name, suspicious_data):
         sheet_name: The name of the sheet to add the summary to
         suspicious_data: Dictionary containing suspicious content data
     """
-    worksheet = workbook[sheet_name]
-    
-    # Add title
-    title_cell = worksheet.cell(row=1, column=1)
-    title_cell.value = "Suspicious Content Summary"
-    title_cell.font = Font(bold=True, size=14)
-    
-    # Add suspicious content data
-    row = 3
-    for key, value in suspicious_data.items():
-        worksheet.cell(row=row, column=1, value=key)
-        worksheet.cell(row=row, column=2, value=value)
-        row += 1
-    
-    # Format the summary
-    for col in range(1, 3):
-        worksheet.column_dimensions[get_column_letter(col)].width = 20
-        for row in range(1, row):
-            cell = worksheet.cell(row=row, column=col)
-            cell.alignment = Alignment(horizontal='left', vertical='center') 
\ No newline at end of file
+    _add_key_value_summary(workbook[sheet_name], "Suspicious Content Summary", suspicious_data)
@@ -1,12 +1,18 @@
 # file_processor.py
+import logging
+import numpy as np
 import pandas as pd
 import traceback
 from openpyxl.styles import Font, Alignment, PatternFill
-from core.utils import standardize_semrush_columns, analyze_last_seen_dates, sanitize_sheet_name, extract_domain_from_url
+from core.utils import standardize_semrush_columns, analyze_last_seen_dates, sanitize_sheet_name, extract_domain_from_url, \
+    extract_domain_name
 from openpyxl.utils import get_column_letter
+from core.file_operations import read_csv_file, read_excel_file
 from content_analysis.detection import analyze_content
 from content_analysis.reporting import add_dodgy_domain_sheet, create_valid_sheet_name
 
+logger = logging.getLogger(__name__)
+
 # Import from new module structure - with corrected import paths
 try:
     from excel_utils import add_df_to_worksheet, add_navigation_links
@@ -20,12 +26,11 @@ except ImportError:
 
 def read_backlink_file(file_path):
     """Read a backlink file (CSV or Excel)"""
-    import pandas as pd
     try:
         if file_path.lower().endswith('.csv'):
-            df = pd.read_csv(file_path)
+            df = read_csv_file(file_path)
         else:
-            df = pd.read_excel(file_path)
+            df = read_excel_file(file_path)
         print(f"Loaded data with {len(df)} rows.")
         return df
     except Exception as e:
@@ -33,6 +38,16 @@ def read_backlink_file(file_path):
         return None
 
 
+def read_backlink_chunks(file_path, chunksize=200_000):
+    """Yield a backlink file (CSV or Excel) as DataFrames of at most chunksize rows"""
+    if file_path.lower().endswith('.csv'):
+        with read_csv_file(file_path, chunksize=chunksize) as reader:
+            yield from reader
+    else:
+        # Excel files cannot be read incrementally
+        yield read_excel_file(file_path)
+
+
 # Import configuration
 try:
     from config import FEATURES
@@ -108,7 +123,7 @@ def create_summary_statistics(df):
 
     # Count dofollow vs nofollow
     if 'Nofollow' in df.columns:
-        dofollow_count = len(df[~df['Nofollow']])
+        dofollow_count = int((~df['Nofollow']).sum())
         stats['Dofollow Links'] = dofollow_count
         stats['Nofollow Links'] = len(df) - dofollow_count
 
@@ -121,8 +136,9 @@ def create_summary_statistics(df):
             # If it's a string or other type
             lost_links = df['Lost link'].notna() & (df['Lost link'] != '') & (df['Lost link'] != 'False')
 
-        stats['Lost Links'] = lost_links.sum()
-        stats['Active Links'] = len(df) - lost_links.sum()
+        lost_count = int(lost_links.sum())
+        stats['Lost Links'] = lost_count
+        stats['Active Links'] = len(df) - lost_count
 
     # Average Page ascore
     if 'Page ascore' in df.columns:
@@ -138,8 +154,13 @@ def group_similar_backlinks(df, enable_grouping=True):
 
     if 'Source title' in df.columns and 'Source url' in df.columns and 'Anchor' in df.columns:
         try:
+            # Sort once on the key columns so the groupby sees contiguous runs
+            group_keys = ['Source title', 'Source url', 'Anchor']
+            df = df.sort_values(group_keys, kind='mergesort')
+            groups = df.groupby(group_keys, sort=False)
+
             # Group by the key columns
-            grouped = df.groupby(['Source title', 'Source url', 'Anchor']).agg({
+            grouped = groups.agg({
                 'Page ascore': 'mean',  # Average score for grouped links
                 'External links': 'mean',  # Average external links
                 'First seen': 'min',  # Earliest first seen date
@@ -156,9 +177,8 @@ def group_similar_backlinks(df, enable_grouping=True):
                 if col in grouped.columns:
                     grouped[col] = grouped[col].round(1)
 
-            # Add count column to show frequency
-            counts = df.groupby(['Source title', 'Source url', 'Anchor']).size().reset_index(name='Frequency')
-            grouped = grouped.merge(counts, on=['Source title', 'Source url', 'Anchor'])
+            # Add count column to show frequency (same group order as the aggregation)
+            grouped['Frequency'] = groups.size().to_numpy()
 
             # Sort by frequency in descending order
             grouped = grouped.sort_values('Frequency', ascending=False)
@@ -179,15 +199,11 @@ def get_domain_everything_df(file_path):
         return None, None
 
     # Apply the same preprocessing as in process_backlink_file
-    from utils import standardize_semrush_columns, remove_translation_references
     df = standardize_semrush_columns(df)
-    # Remove any translation-related columns
-    df = remove_translation_references(df)
     df = add_referring_domain_column(df)
     df = add_domain_backlinks_count(df)
 
     # Extract domain name from the file path
-    from core.utils import extract_domain_name
     domain = extract_domain_name(file_path)  # Get domain name from file path
 
     # Group similar backlinks if enabled
@@ -237,76 +253,93 @@ def standardize_column_names(df):
     return df
 
 
-def process_backlink_file(workbook, file_path, domain_name, sheet_number=None):
+def analyze_backlink_file(file_path, domain_name):
     """
-    Process a single backlink file and add it to the workbook.
+    Read a backlink file and detect its suspicious content, without touching a workbook.
+
+    Safe to run in a worker process; process_backlink_file adds the results to the workbook.
+
+    Returns:
+        Tuple of (success, domain_results), where domain_results is None when
+        nothing suspicious was found
     """
-    # Create valid sheet names
-    everything_sheet_name = create_valid_sheet_name(domain_name, "_Everything")
-    dodgy_sheet_name = create_valid_sheet_name(domain_name, "_dodgy")
-    
-    import logging
-    import traceback
-    from pandas import DataFrame
-    
-    # Set up logging
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
-    
     try:
         # Validate domain
         if not domain_name:
             logger.warning(f"No domain name provided for {file_path}")
-            return False, None, None
+            return False, None
             
-        # Read the file
+        # Read the file in chunks so only the flagged rows are kept in memory
         logger.info(f"Reading file: {file_path}")
-        df = read_backlink_file(file_path)
-        
-        # Validate dataframe
-        if df is None:
-            logger.error(f"Failed to read file: {file_path}")
-            return False, None, None
-            
-        if not isinstance(df, DataFrame):
-            logger.error(f"Invalid data type returned from read_backlink_file: {type(df)}")
-            return False, None, None
-            
-        if df.empty:
-            logger.warning(f"Empty dataframe in file: {file_path}")
-            return False, None, None
-            
-        # Standardize column names
-        logger.info("Standardizing column names")
-        df = standardize_column_names(df)
-        
-        # Validate required columns
         required_columns = ['Source url', 'Target url', 'Page ascore', 'External links']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            logger.error(f"Missing required columns in {file_path}: {missing_columns}")
-            return False, None, None
-            
-        # Add referring domain column
-        logger.info("Adding referring domain column")
-        df = add_referring_domain_column(df)
-        
-        # Validate domain data
-        if 'Referring Domain' not in df.columns:
-            logger.error(f"No domain data found in {file_path}")
-            return False, None, None
-            
-        # Add domain backlinks count
-        logger.info("Adding domain backlinks count")
-        df = add_domain_backlinks_count(df)
-        
-        # Analyze content for suspicious keywords
-        logger.info("Analyzing content for suspicious keywords")
-        domain_results = analyze_content(df, domain_name=domain_name)
-        
+        total_rows = 0
+        dodgy_frames = []
+
+        for chunk_idx, chunk in enumerate(read_backlink_chunks(file_path)):
+            # Standardize column names
+            chunk = standardize_column_names(chunk)
+
+            # Validate required columns (the header is the same for every chunk)
+            if chunk_idx == 0:
+                missing_columns = [col for col in required_columns if col not in chunk.columns]
+                if missing_columns:
+                    logger.error(f"Missing required columns in {file_path}: {missing_columns}")
+                    return False, None
+
+            if chunk.empty:
+                continue
+            total_rows += len(chunk)
+
+            # Add referring domain column
+            chunk = add_referring_domain_column(chunk)
+
+            # Validate domain data
+            if 'Referring Domain' not in chunk.columns:
+                logger.error(f"No domain data found in {file_path}")
+                return False, None
+
+            # Analyze content for suspicious keywords
+            chunk_results = analyze_content(chunk, domain_name=domain_name)
+            if not chunk_results.empty:
+                dodgy_frames.append(chunk_results)
+
+        if total_rows == 0:
+            logger.warning(f"Empty dataframe in file: {file_path}")
+            return False, None
+
+        logger.info(f"Analyzed {total_rows} rows for suspicious keywords")
+
+        if dodgy_frames:
+            return True, pd.concat(dodgy_frames, ignore_index=True)
+        return True, None
+
+    except Exception as e:
+        logger.error(f"Error processing file {file_path}: {str(e)}")
+        logger.error("Traceback:", exc_info=True)
+        return False, None
+
+
+def process_backlink_file(workbook, file_path, domain_name, sheet_number=None, file_results=None):
+    """
+    Process a single backlink file and add it to the workbook.
+
+    file_results, if given, is the (success, domain_results) tuple already
+    returned by analyze_backlink_file for this file.
+    """
+    # Create valid sheet names
+    everything_sheet_name = create_valid_sheet_name(domain_name, "_Everything")
+    dodgy_sheet_name = create_valid_sheet_name(domain_name, "_dodgy")
+
+    if file_results is None:
+        file_results = analyze_backlink_file(file_path, domain_name)
+    success, domain_results = file_results
+    if not success:
+        return False, None, None
+    
+    try:
         # If dodgy keywords found, create a domain-specific dodgy sheet
-        if not domain_results.empty:
-            add_dodgy_domain_sheet(workbook, domain_name, domain_results, df, sheet_number)
+        if domain_results is not None:
+            add_dodgy_domain_sheet(workbook, domain_name, domain_results, sheet_number=sheet_number)
             logger.info(f"Created dodgy sheet for domain: {domain_name}")
         
         logger.info(f"Successfully processed file: {file_path}")
@@ -384,12 +417,15 @@ def create_time_summary(df):
                 'Over 2 years': float('inf')
             }
 
-            # Count links in each age bucket
-            prev_limit = 0
-            for label, limit in age_buckets.items():
-                count = len(df[(df['Age'] > prev_limit) & (df['Age'] <= limit)])
-                time_summary[f'Links {label}'] = count
-                prev_limit = limit
+            # Count links in each age bucket with a single pass over the ages.
+            # Bucket i covers (edges[i-1], edges[i]]; index 0 holds ages <= 0.
+            ages = df['Age'].to_numpy(dtype=float, na_value=np.nan)
+            ages = ages[~np.isnan(ages)]
+            edges = np.array([0] + list(age_buckets.values())[:-1], dtype=float)
+            bucket_idx = np.searchsorted(edges, ages, side='left')
+            counts = np.bincount(bucket_idx, minlength=len(age_buckets) + 1)
+            for label, count in zip(age_buckets, counts[1:]):
+                time_summary[f'Links {label}'] = int(count)
 
         except Exception as e:
             print(f"Error creating time summary: {e}")
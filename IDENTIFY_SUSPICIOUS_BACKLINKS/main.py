@@ -1,9 +1,12 @@
 # main.py
 import sys
 import os
+import re
 import logging
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 # Add parent directory to Python path
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -16,10 +19,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Backlink exports that process_files picks up from an input directory
+BACKLINK_FILE_EXTENSIONS = ('.xlsx', '.xls', '.csv')
+
+# Everything before the first "-backlinks" or " (" in a file name is the domain
+_DOMAIN_FROM_FILE = re.compile(r'(.*?)(?:-backlinks| \(|$)', re.DOTALL)
+
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-import glob
-from core.utils import extract_domain_name, get_output_filename
+from core.utils import standardize_semrush_columns, extract_domains_from_urls
 from core.file_operations import read_backlink_file
 
 # Import from new module structure with corrected import paths
@@ -42,7 +50,7 @@ except ImportError as e:
         logger.warning("Using fallback add_content_analysis_sheet function")
         return None, {}, {}
 
-from file_processor import process_backlink_file, get_domain_everything_df
+from file_processor import analyze_backlink_file, process_backlink_file, get_domain_everything_df
 
 # Import configuration
 try:
@@ -72,15 +80,14 @@ def count_domain_backlinks(file_path):
             return {}
 
         # Standardize column names
-        from utils import standardize_semrush_columns
         df = standardize_semrush_columns(df)
 
         # Extract domain from source URL
-        from core.utils import extract_domain_from_url
         domain_col = 'Source url'
         if domain_col in df.columns:
-            domains = df[domain_col].apply(extract_domain_from_url)
-            domain_counts = domains.value_counts().to_dict()
+            # Rows without a URL (or without a domain in it) have no domain to count
+            domains = extract_domains_from_urls(df[domain_col].dropna())
+            domain_counts = domains[domains != ''].value_counts(sort=False).to_dict()
             logger.info(f"Found {len(domain_counts)} unique domains in {file_path}")
             return domain_counts
         logger.warning(f"Source URL column not found in {file_path}")
@@ -130,14 +137,15 @@ def process_files(input_path, output_path=None):
 
         # Get files to process
         if os.path.isdir(input_path):
-            # Process all files in directory
-            all_files = []
-            for ext in ['*.xlsx', '*.xls', '*.csv']:
-                file_glob = os.path.join(input_path, ext)
-                logger.info(f"Searching for files matching pattern: {file_glob}")
-                found_files = glob.glob(file_glob)
-                logger.info(f"Found {len(found_files)} files matching {ext}")
-                all_files.extend(found_files)
+            # Process all files in directory, listed in a single scan and in name order
+            logger.info(f"Searching for {', '.join(BACKLINK_FILE_EXTENSIONS)} files in: {input_path}")
+            with os.scandir(input_path) as entries:
+                all_files = sorted(
+                    entry.path for entry in entries
+                    if not entry.name.startswith('.')
+                    and os.path.splitext(entry.name)[1] in BACKLINK_FILE_EXTENSIONS
+                    and entry.is_file()
+                )
         else:
             # Process single file
             all_files = [input_path]
@@ -153,32 +161,40 @@ def process_files(input_path, output_path=None):
         processed_files = []
         failed_files = []
 
-        # Process each file
-        for file_path in all_files:
-            try:
-                # Extract domain name from file path
-                domain = extract_domain_from_file_path(file_path)
-                if not domain:
-                    logger.warning(f"Could not extract domain from {file_path}")
-                    failed_files.append((file_path, "Could not extract domain"))
+        # Read and analyze the files in parallel worker processes; each file is
+        # independent. Only adding the results to the workbook happens here,
+        # one file at a time, as the workbook cannot be shared between processes
+        file_domains = [extract_domain_from_file_path(file_path) for file_path in all_files]
+        jobs = [(file_path, domain) for file_path, domain in zip(all_files, file_domains) if domain]
+        with ProcessPoolExecutor() as executor:
+            file_futures = {file_path: executor.submit(analyze_backlink_file, file_path, domain)
+                            for file_path, domain in jobs}
+
+            # Process each file
+            for file_path, domain in zip(all_files, file_domains):
+                try:
+                    if not domain:
+                        logger.warning(f"Could not extract domain from {file_path}")
+                        failed_files.append((file_path, "Could not extract domain"))
+                        continue
+
+                    logger.info(f"Processing file {file_path} for domain {domain}")
+                    # Process the file
+                    file_results = file_futures[file_path].result()
+                    success, _, _ = process_backlink_file(workbook, file_path, domain, None, file_results)
+                    if success:
+                        logger.info(f"Successfully processed {file_path}")
+                        processed_files.append(file_path)
+                    else:
+                        logger.error(f"Failed to process {file_path}")
+                        failed_files.append((file_path, "Processing failed"))
+
+                except Exception as e:
+                    logger.error(f"Error processing {file_path}: {str(e)}")
+                    logger.error("Traceback: %s", traceback.format_exc())
+                    failed_files.append((file_path, str(e)))
                     continue
 
-                logger.info(f"Processing file {file_path} for domain {domain}")
-                # Process the file
-                success, _, _ = process_backlink_file(workbook, file_path, domain, None)
-                if success:
-                    logger.info(f"Successfully processed {file_path}")
-                    processed_files.append(file_path)
-                else:
-                    logger.error(f"Failed to process {file_path}")
-                    failed_files.append((file_path, "Processing failed"))
-
-            except Exception as e:
-                logger.error(f"Error processing {file_path}: {str(e)}")
-                logger.error("Traceback: %s", traceback.format_exc())
-                failed_files.append((file_path, str(e)))
-                continue
-
         # Log summary
         logger.info(f"Successfully processed {len(processed_files)} files")
         if failed_files:
@@ -203,14 +219,13 @@ def process_files(input_path, output_path=None):
         return None
 
 
+@lru_cache(maxsize=None)
 def extract_domain_from_file_path(file_path):
     """Extract domain name from a file path"""
-    import os
     # Get the filename without extension
     filename = os.path.basename(file_path)
     # Remove the -backlinks part and any numbers in parentheses
-    domain = filename.split('-backlinks')[0].split(' (')[0]
-    return domain
+    return _DOMAIN_FROM_FILE.match(filename).group(1)
 
 
 def get_output_filename(base_dir):
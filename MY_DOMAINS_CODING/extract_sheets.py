@@ -3,32 +3,24 @@ import os
 from config import DEFAULT_OUTPUT_DIRECTORY, EVERYTHING_QUALITY_DIR, SUMMARY_DIR, QUALITY_BACKLINK_SETTINGS
 from urllib.parse import urlparse
 import tldextract
+from concurrent.futures import ProcessPoolExecutor
 
 # Set SEMRUSH directory
 semrush_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'MY_DOMAINS'))
-print(f"Looking for SEMRUSH files in: {semrush_dir}")
 
 # Set output directories
 base_output_dir = os.path.dirname(os.path.abspath(__file__))
 everything_quality_dir = os.path.join(base_output_dir, EVERYTHING_QUALITY_DIR)
 summary_dir = os.path.join(base_output_dir, SUMMARY_DIR)
 
-print(f"Output directories:")
-print(f"Base output: {base_output_dir}")
-print(f"Everything quality: {everything_quality_dir}")
-print(f"Summary: {summary_dir}")
-
-# Create output directories if they don't exist
-for directory in [base_output_dir, everything_quality_dir, summary_dir]:
-    if not os.path.exists(directory):
-        os.makedirs(directory)
-        print(f"Created directory: {directory}")
-
 DOMAIN_PRICES = {
     'iprescribeexercise.com': 150,
     'joyofenjoy.com': 315
 }
 
+# Columns whose mean and median are reported in the summary
+METRIC_COLUMNS = ['Page ascore', 'External links']
+
 def get_core_domain(url):
     """Extract the core domain from a URL, using only the main TLD"""
     try:
@@ -81,10 +73,9 @@ def process_csv_file(input_file, summary_data):
         # Calculate everything metrics
         everything_backlinks = len(df)
         everything_domains = df['Source url'].nunique()
-        everything_avg_as = df['Page ascore'].mean()
-        everything_median_as = df['Page ascore'].median()
-        everything_avg_ext_links = df['External links'].mean()
-        everything_median_ext_links = df['External links'].median()
+        everything_stats = df[METRIC_COLUMNS].agg(['mean', 'median'])
+        everything_avg_as, everything_median_as = everything_stats['Page ascore']
+        everything_avg_ext_links, everything_median_ext_links = everything_stats['External links']
         
         # Apply quality filters
         quality_df = df.copy()
@@ -101,35 +92,27 @@ def process_csv_file(input_file, summary_data):
         
         # Get one backlink per domain (with least external links)
         if not quality_df.empty:
-            # Create a list to store unique domains and their best backlinks
-            unique_domains = {}  # Dictionary to store domain -> best backlink mapping
-            
-            # Sort by external links to process lowest first
+            # Sort by external links so the first row per domain has the fewest
             quality_df = quality_df.sort_values('External links')
             
-            # Loop through each row
-            for _, row in quality_df.iterrows():
-                # Extract domain from URL
-                source_domain = extract_domain_from_url(row['Source url'])
-                
-                if source_domain:
-                    # If domain not in list or current row has fewer external links
-                    if source_domain not in unique_domains:
-                        unique_domains[source_domain] = row
-                    elif row['External links'] < unique_domains[source_domain]['External links']:
-                        unique_domains[source_domain] = row
-            
-            # Convert the dictionary back to a DataFrame
-            quality_df = pd.DataFrame(list(unique_domains.values()))
-        
+            # Extract each row's domain and keep the first row of each
+            source_domains = quality_df['Source url'].map(extract_domain_from_url).fillna('')
+            has_domain = source_domains != ''
+            quality_df = quality_df[has_domain]
+            quality_df = quality_df[~source_domains[has_domain].duplicated()]
+
+            # Nothing to report (or summarise) if no quality backlink has a source domain
+            if quality_df.empty:
+                print(f"No quality backlinks with a source domain in {input_file}")
+                return
+
         # Calculate quality domains AFTER deduplication (number of unique referring domains)
         quality_domains = quality_df['Source url'].nunique()
         
         # Calculate quality metrics
-        quality_avg_as = quality_df['Page ascore'].mean()
-        quality_median_as = quality_df['Page ascore'].median()
-        quality_avg_ext_links = quality_df['External links'].mean()
-        quality_median_ext_links = quality_df['External links'].median()
+        quality_stats = quality_df[METRIC_COLUMNS].agg(['mean', 'median'])
+        quality_avg_as, quality_median_as = quality_stats['Page ascore']
+        quality_avg_ext_links, quality_median_ext_links = quality_stats['External links']
         
         # Create quality CSV in directory
         quality_csv = os.path.join(everything_quality_dir, f'{domain}_{price}_quality.csv')
@@ -157,29 +140,51 @@ def process_csv_file(input_file, summary_data):
     except Exception as e:
         print(f"Error processing file: {str(e)}")
 
-# Process all CSV files in the SEMRUSH directory
-if os.path.exists(semrush_dir):
-    files = [f for f in os.listdir(semrush_dir) if f.endswith('.csv')]
-    if files:
-        print(f"\nProcessing {len(files)} CSV files...")
-        summary_data = []  # Initialize summary data list
-        for file in files:
-            file_path = os.path.join(semrush_dir, file)
-            print(f"\nProcessing: {file}")
-            process_csv_file(file_path, summary_data)
-        
-        # Create summary CSV with all domains
-        if summary_data:
-            summary_df = pd.DataFrame(summary_data)
-            # Round all numeric columns to 0 decimal places
-            for col in summary_df.select_dtypes(include=['float', 'int']).columns:
-                summary_df[col] = summary_df[col].round(0).astype('int64')
-            summary_csv = os.path.join(summary_dir, 'summary.csv')
-            summary_df.to_csv(summary_csv, index=False)
-            print(f"\nCreated summary file with {len(summary_data)} domains: {summary_csv}")
+def process_csv_file_worker(input_file):
+    """Run process_csv_file in a worker process and return its summary rows"""
+    print(f"\nProcessing: {os.path.basename(input_file)}")
+    summary_data = []
+    process_csv_file(input_file, summary_data)
+    return summary_data
+
+if __name__ == "__main__":
+    print(f"Looking for SEMRUSH files in: {semrush_dir}")
+    print(f"Output directories:")
+    print(f"Base output: {base_output_dir}")
+    print(f"Everything quality: {everything_quality_dir}")
+    print(f"Summary: {summary_dir}")
+
+    # Create output directories if they don't exist
+    for directory in [base_output_dir, everything_quality_dir, summary_dir]:
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+            print(f"Created directory: {directory}")
+
+    # Process all CSV files in the SEMRUSH directory
+    if os.path.exists(semrush_dir):
+        with os.scandir(semrush_dir) as entries:
+            file_paths = [entry.path for entry in entries if entry.name.endswith('.csv') and entry.is_file()]
+        if file_paths:
+            print(f"\nProcessing {len(file_paths)} CSV files...")
+            summary_data = []  # Initialize summary data list
+            # Process the CSV files in parallel; each file is independent
+            with ProcessPoolExecutor() as executor:
+                for file_summary in executor.map(process_csv_file_worker, file_paths):
+                    summary_data.extend(file_summary)
+            
+            # Create summary CSV with all domains
+            if summary_data:
+                summary_df = pd.DataFrame(summary_data)
+                # Round all numeric columns to 0 decimal places, in one pass (a domain
+                # with no quality backlinks has no averages; those are written as 0)
+                numeric_cols = summary_df.select_dtypes(include=['float', 'int']).columns
+                summary_df[numeric_cols] = summary_df[numeric_cols].fillna(0).round(0).astype('int64')
+                summary_csv = os.path.join(summary_dir, 'summary.csv')
+                summary_df.to_csv(summary_csv, index=False)
+                print(f"\nCreated summary file with {len(summary_data)} domains: {summary_csv}")
+        else:
+            print(f"No CSV files found in {semrush_dir}")
     else:
-        print(f"No CSV files found in {semrush_dir}")
-else:
-    print(f"Directory {semrush_dir} not found")
+        print(f"Directory {semrush_dir} not found")
 
-print("\nProcessing complete!") 
\ No newline at end of file
+    print("\nProcessing complete!") 
\ No newline at end of file
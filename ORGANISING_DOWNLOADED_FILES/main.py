@@ -25,10 +25,10 @@ def create_date_folders():
     
     return backlinks_folder, outgoing_domains_folder
 
-def is_file_from_today(file_path):
-    """Check if a file was created today."""
-    file_time = datetime.fromtimestamp(os.path.getctime(file_path))
-    return file_time.date() == datetime.now().date()
+def is_file_from_today(entry, today):
+    """Check if a directory entry was created today, using its cached stat result."""
+    file_time = datetime.fromtimestamp(entry.stat().st_ctime)
+    return file_time.date() == today
 
 def organize_downloaded_files():
     """Main function to organize downloaded files."""
@@ -42,34 +42,43 @@ def organize_downloaded_files():
     processed_files = []
     skipped_files = []
     
+    today = datetime.now().date()
+
     # Process each file in Downloads
-    for filename in os.listdir(downloads_dir):
-        if not filename.endswith('.csv'):
-            continue
-            
-        file_path = os.path.join(downloads_dir, filename)
-        
-        # Skip if not created today
-        if not is_file_from_today(file_path):
-            continue
+    with os.scandir(downloads_dir) as entries:
+        for entry in entries:
+            filename = entry.name
+            if not filename.endswith('.csv'):
+                continue
+
+            file_path = entry.path
+
+            # Skip if not created today
+            if not is_file_from_today(entry, today):
+                continue
         
-        # Determine target folder based on filename
-        if filename.endswith('-backlinks.csv'):
-            target_folder = backlinks_folder
-        elif filename.endswith('-backlinks_outgoing_domains.csv'):
-            target_folder = outgoing_domains_folder
-        else:
-            skipped_files.append(filename)
-            continue
+            # Determine target folder based on filename
+            if filename.endswith('-backlinks.csv'):
+                target_folder = backlinks_folder
+            elif filename.endswith('-backlinks_outgoing_domains.csv'):
+                target_folder = outgoing_domains_folder
+            else:
+                skipped_files.append(filename)
+                continue
         
-        # Move the file
-        try:
-            target_path = os.path.join(target_folder, filename)
-            shutil.move(file_path, target_path)
-            processed_files.append(filename)
-            logger.info(f"Moved {filename} to {target_folder}")
-        except Exception as e:
-            logger.error(f"Error moving {filename}: {str(e)}")
+            # Move the file
+            try:
+                target_path = os.path.join(target_folder, filename)
+                try:
+                    # Atomic rename when source and target share a filesystem
+                    os.replace(file_path, target_path)
+                except OSError:
+                    # Cross-device move: fall back to copy + delete
+                    shutil.move(file_path, target_path)
+                processed_files.append(filename)
+                logger.info(f"Moved {filename} to {target_folder}")
+            except Exception as e:
+                logger.error(f"Error moving {filename}: {str(e)}")
     
     # Print summary
     logger.info("\nSummary:")
@@ -1,7 +1,6 @@
 import os
 import glob
 import pandas as pd
-from collections import defaultdict
 
 def get_latest_collated_file():
     current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -28,22 +27,19 @@ def main():
     df['Expires'] = pd.to_datetime(df['Expires'], errors='coerce')
     df = df.dropna(subset=['Expires'])
 
-    # Group previously sold domains by expiration date
-    sold_by_date = defaultdict(list)
-    for _, row in df.iterrows():
-        domain = str(row['Name']).strip()
-        exp_date = row['Expires'].date()
-        sold_by_date[exp_date].append(domain)
+    # Group previously sold domains by expiration date (in order of first appearance)
+    names = df['Name'].map(str).str.strip()
+    sold_by_date = names.groupby(df['Expires'].dt.date, sort=False)
 
     # Write one file per expiration date
-    for exp_date, domains in sold_by_date.items():
+    for exp_date, domains in sold_by_date:
         out_path = os.path.join(output_dir, f"sold_domains_{exp_date}.txt")
         with open(out_path, 'w', encoding='utf-8') as f:
             f.write(f"Previously Sold Domains Expiring on {exp_date}\n")
             f.write("=" * 50 + "\n\n")
             for domain in sorted(domains):
                 f.write(domain + "\n")
-    print(f"Wrote {len(sold_by_date)} files to {output_dir}")
+    print(f"Wrote {sold_by_date.ngroups} files to {output_dir}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
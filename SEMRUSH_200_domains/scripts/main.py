@@ -1,5 +1,6 @@
 import os
 import glob
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
@@ -7,6 +8,12 @@ import time
 
 from config import Config
 
+# pyahocorasick is optional; it finds every keyword in a name in a single pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(levelname)s - %(message)s')
@@ -34,6 +41,29 @@ DODGY_KEYWORDS = {
     ]
 }
 
+# Every dodgy keyword with its category, in DODGY_KEYWORDS order
+KEYWORD_CATEGORIES = [(word, cat) for cat, keywords in DODGY_KEYWORDS.items() for word in keywords]
+
+
+def _build_keyword_matcher():
+    """Return a function giving the indices (into KEYWORD_CATEGORIES) of the keywords in a name, in order."""
+    if ahocorasick is None:
+        def matched_keyword_indices(domain):
+            return [idx for idx, (word, _) in enumerate(KEYWORD_CATEGORIES) if word in domain]
+        return matched_keyword_indices
+
+    automaton = ahocorasick.Automaton()
+    for idx, (word, _) in enumerate(KEYWORD_CATEGORIES):
+        automaton.add_word(word, idx)
+    automaton.make_automaton()
+
+    def matched_keyword_indices(domain):
+        return sorted({idx for _, idx in automaton.iter(domain)})
+    return matched_keyword_indices
+
+
+_matched_keyword_indices = _build_keyword_matcher()
+
 REQUIRED_COLUMNS = {'Name', 'SZ Drops', 'Age', 'Source', 'Expires'}
 
 def load_domains_df(csv_path):
@@ -44,21 +74,26 @@ def load_domains_df(csv_path):
         raise ValueError(f"CSV is missing columns: {missing_cols}")
     return df
 
-def find_dodgy_domains(df):
+def lowercase_names(df):
+    """Return the domain names as lowercase strings."""
+    return df['Name'].map(str).str.lower()
+
+def find_dodgy_domains(df, names_lower=None):
     """Return set of dodgy domains and details."""
     dodgy_domains = set()
     details = []
     category_matches = {cat: 0 for cat in DODGY_KEYWORDS}
 
-    for _, row in df.iterrows():
-        domain = str(row['Name']).lower()
+    if names_lower is None:
+        names_lower = lowercase_names(df)
+    for domain in names_lower:
         matches = []
         matched_cats = set()
-        for cat, keywords in DODGY_KEYWORDS.items():
-            for word in keywords:
-                if word in domain:
-                    matches.append(word)
-                    matched_cats.add(cat)
+        # All keywords of all categories are found in one scan of the name
+        for idx in _matched_keyword_indices(domain):
+            word, cat = KEYWORD_CATEGORIES[idx]
+            matches.append(word)
+            matched_cats.add(cat)
         if matches:
             dodgy_domains.add(domain)
             for cat in matched_cats:
@@ -70,51 +105,65 @@ def find_dodgy_domains(df):
             })
     return dodgy_domains, category_matches, details
 
-def get_clean_domains(df, dodgy_domains):
+def _ages_as_float(age):
+    """Return the ages as floats, and a mask of the ages float() cannot convert."""
+    if pd.api.types.is_numeric_dtype(age):
+        return age.astype(float), pd.Series(False, index=age.index)
+
+    def to_float(value):
+        try:
+            return float(value), False
+        except Exception:
+            return np.nan, True
+
+    converted = [to_float(value) for value in age]
+    values = pd.Series([value for value, _ in converted], index=age.index, dtype=float)
+    invalid = pd.Series([failed for _, failed in converted], index=age.index, dtype=bool)
+    return values, invalid
+
+def get_clean_domains(df, dodgy_domains, names_lower=None):
     """Return a list of domain names that pass all exclusion filters."""
-    clean = []
-    excessive_drops = 0
-    age_drop_excluded = 0
-    today = pd.Timestamp.now().date()
-    for _, row in df.iterrows():
-        domain = str(row['Name']).lower()
-        sz_drops = row['SZ Drops']
-        age = row['Age']
-        if domain in dodgy_domains:
-            continue
-        if not pd.isna(sz_drops) and sz_drops > 4:
-            excessive_drops += 1
-            continue
-        # Exclude if age/drops ratio <= 1 (and drops not zero/NaN)
-        if not pd.isna(age) and not pd.isna(sz_drops) and sz_drops:
-            try:
-                if float(age) / float(sz_drops) <= 1:
-                    age_drop_excluded += 1
-                    continue
-            except Exception:
-                continue
-        clean.append(row['Name'])
-    return clean, excessive_drops, age_drop_excluded
+    names = df['Name']
+    sz_drops = df['SZ Drops']
+    age = df['Age']
+
+    # Dodgy domains are dropped without being counted
+    if names_lower is None:
+        names_lower = lowercase_names(df)
+    candidates = ~names_lower.isin(dodgy_domains)
+
+    excessive_mask = candidates & sz_drops.notna() & (sz_drops > 4)
+    candidates &= ~excessive_mask
+
+    # Exclude if age/drops ratio <= 1 (and drops not zero/NaN); ages that are
+    # not numbers are dropped without being counted
+    ratio_applies = candidates & age.notna() & sz_drops.notna() & (sz_drops != 0)
+    age_values, age_invalid = _ages_as_float(age)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        age_drop_mask = ratio_applies & ~age_invalid & (age_values / sz_drops.astype(float) <= 1)
+    candidates &= ~age_drop_mask & ~(ratio_applies & age_invalid)
+
+    clean = names[candidates].tolist()
+    return clean, int(excessive_mask.sum()), int(age_drop_mask.sum())
 
 def daily_expiry_breakdown(df, clean_domains):
     """Return a dict of expiry date counts for the next 7 days."""
     expiry_counts = {}
     today = pd.Timestamp.now().date()
+    last_day = today + timedelta(days=7)
     for i in range(8):
         expiry_counts[today + timedelta(days=i)] = 0
-    for _, row in df.iterrows():
-        if row['Name'] not in clean_domains:
-            continue
-        expiry_date = row['Expires']
-        if pd.isnull(expiry_date):
-            continue
+
+    # Expiry values of the clean domains, each distinct value parsed once
+    expiry_values = df.loc[df['Name'].isin(clean_domains), 'Expires']
+    for expiry_date, count in expiry_values.value_counts().items():
         try:
             # Handles most common formats robustly
             date_obj = pd.to_datetime(expiry_date, errors='coerce').date()
         except Exception:
             continue
-        if today <= date_obj <= today + timedelta(days=7):
-            expiry_counts[date_obj] += 1
+        if today <= date_obj <= last_day:
+            expiry_counts[date_obj] += int(count)
     return expiry_counts
 
 def write_clean_domains(clean_domains, out_dir, batch_size=200, force=False):
@@ -142,13 +191,20 @@ def write_clean_domains(clean_domains, out_dir, batch_size=200, force=False):
 def verify_output_files(output_dir, dodgy_domains):
     """Verify no dodgy domains ended up in the output."""
     found = 0
-    for file in os.listdir(output_dir):
-        if file.startswith("domains_") and file.endswith(".txt"):
-            with open(os.path.join(output_dir, file), 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip().lower() in dodgy_domains:
-                        logging.error(f"Dodgy domain found in output: {line.strip()}")
-                        found += 1
+    with os.scandir(output_dir) as entries:
+        output_files = [entry.path for entry in entries
+                        if entry.name.startswith("domains_") and entry.name.endswith(".txt")]
+    for path in output_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        # One set check per file; lines are only scanned again (to log
+        # each occurrence) when the file does hold a dodgy domain
+        if {line.strip().lower() for line in lines}.isdisjoint(dodgy_domains):
+            continue
+        for line in lines:
+            if line.strip().lower() in dodgy_domains:
+                logging.error(f"Dodgy domain found in output: {line.strip()}")
+                found += 1
     if found:
         logging.error("Verification failed!")
     else:
@@ -228,8 +284,10 @@ def process_domains(force=False):
         if missing_cols:
             raise ValueError(f"CSV is missing columns: {missing_cols}")
         
-        # Detailed domain filtering logging
-        dodgy_domains, category_matches, details = find_dodgy_domains(df)
+        # Detailed domain filtering logging; both filters match on the
+        # lowercase names, which are computed once for the two of them
+        names_lower = lowercase_names(df)
+        dodgy_domains, category_matches, details = find_dodgy_domains(df, names_lower)
         logging.info("\nDodgy Domain Details:")
         for detail in details:
             logging.info(f"Dodgy Domain: {detail['domain']} - Keywords: {detail['matched_keywords']}, Categories: {detail['matched_categories']}")
@@ -239,7 +297,7 @@ def process_domains(force=False):
         for cat, count in category_matches.items():
             logging.info(f"  {cat}: {count}")
         
-        clean_domains, excessive_drops, age_drop_excluded = get_clean_domains(df, dodgy_domains)
+        clean_domains, excessive_drops, age_drop_excluded = get_clean_domains(df, dodgy_domains, names_lower)
         
         logging.info("\nDomain Filtering Summary:")
         logging.info(f"Total Domains: {len(df)}")
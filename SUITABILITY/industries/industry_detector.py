@@ -2,10 +2,38 @@ import re
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
+# pyahocorasick is optional; it finds every keyword in a domain in a single pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Characters the keyword patterns accept (besides a word boundary) either side of a keyword
+_SEPARATORS = ('_', '-', '.')
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether a character is a regex word character (\\w)."""
+    return char.isalnum() or char == '_'
+
+
+def _is_separated(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] is bounded as the compiled keyword patterns require."""
+    before = text[start - 1] if start > 0 else ''
+    after = text[end] if end < len(text) else ''
+    left = (_is_word_char(before) != _is_word_char(text[start])
+            or before.isspace() or before in _SEPARATORS)
+    right = (_is_word_char(text[end - 1]) != _is_word_char(after)
+             or after.isspace() or after in _SEPARATORS)
+    return left and right
+
+
 class IndustryDetector:
     def __init__(self, keywords_file: str = "industry_keywords.txt"):
         self.keywords_file = Path(__file__).parent / keywords_file
         self.industry_keywords: Dict[str, Set[str]] = {}
+        self.keyword_patterns: List[Tuple[str, str, re.Pattern]] = []
+        self.automaton = None
         self.load_keywords()
 
     def load_keywords(self) -> None:
@@ -26,6 +54,26 @@ class IndustryDetector:
                     # This is a category line
                     current_category = line.strip('# ').lower()
 
+        # Compile each keyword's pattern once, rather than for every domain analyzed
+        self.keyword_patterns = [
+            (category, keyword, re.compile(r'(\b|\s|_|-|\.)' + re.escape(keyword) + r'(\b|\s|_|-|\.)'))
+            for category, keywords in self.industry_keywords.items()
+            for keyword in keywords
+        ]
+
+        # With pyahocorasick, one automaton finds every keyword occurrence in a
+        # single pass; each keyword maps to its positions in keyword_patterns
+        self.automaton = None
+        if ahocorasick is not None and self.keyword_patterns:
+            positions: Dict[str, List[int]] = {}
+            for index, (_, keyword, _) in enumerate(self.keyword_patterns):
+                positions.setdefault(keyword, []).append(index)
+            if '' not in positions:
+                self.automaton = ahocorasick.Automaton()
+                for keyword, indices in positions.items():
+                    self.automaton.add_word(keyword, (len(keyword), indices))
+                self.automaton.make_automaton()
+
     def analyze_domain(self, domain: str) -> List[Tuple[str, str]]:
         """
         Analyze a domain name for industry-related keywords.
@@ -38,15 +86,25 @@ class IndustryDetector:
         """
         domain = domain.lower()
         # Replace hyphens, underscores, and dots with spaces for easier matching
-        normalized = re.sub(r'[-_.]', ' ', domain)
+        normalized = ' ' + re.sub(r'[-_.]', ' ', domain) + ' '
         matches = []
         
-        for category, keywords in self.industry_keywords.items():
-            for keyword in keywords:
-                # Match keyword as a whole word or as a substring separated by hyphens/underscores/dots
-                pattern = r'(\b|\s|_|-|\.)' + re.escape(keyword) + r'(\b|\s|_|-|\.)'
-                if re.search(pattern, ' ' + normalized + ' '):
-                    matches.append((category, keyword))
+        # Match keyword as a whole word or as a substring separated by hyphens/underscores/dots
+        if self.automaton is not None:
+            matched = {
+                index
+                for end, (length, indices) in self.automaton.iter(normalized)
+                if _is_separated(normalized, end - length + 1, end + 1)
+                for index in indices
+            }
+            for index in sorted(matched):
+                category, keyword, _ = self.keyword_patterns[index]
+                matches.append((category, keyword))
+            return matches
+
+        for category, keyword, pattern in self.keyword_patterns:
+            if pattern.search(normalized):
+                matches.append((category, keyword))
         
         return matches
 
@@ -461,18 +461,18 @@ def determine_rejection_reasons(df_final, df_all):
             'terrorist', 'extremist', 'supremacist'
         ]
 
-        prohibited_count = 0
-        for index, row in df.iterrows():
-            mt_content = str(row['MT']).lower()
-            found_topics = []
-
-            for topic in strictly_prohibited:
-                if re.search(r'\b' + re.escape(topic) + r'\b', mt_content):
-                    found_topics.append(topic)
-
-            if found_topics:
-                df.at[index, 'Reason'] += f"Prohibited topics: {', '.join(found_topics)}. "
-                prohibited_count += 1
+        # Test each topic against the whole column at once (object dtype keeps
+        # Python's regex semantics); reasons are only built for flagged domains
+        mt_content = df['MT'].map(str).str.lower().astype(object)
+        topic_hits = np.column_stack([
+            mt_content.str.contains(r'\b' + re.escape(topic) + r'\b', regex=True).to_numpy(dtype=bool)
+            for topic in strictly_prohibited
+        ])
+        flagged = topic_hits.any(axis=1)
+        for index, hits in zip(df.index[flagged], topic_hits[flagged]):
+            found_topics = [topic for topic, hit in zip(strictly_prohibited, hits) if hit]
+            df.at[index, 'Reason'] += f"Prohibited topics: {', '.join(found_topics)}. "
+        prohibited_count = int(flagged.sum())
 
         print(f"Found {prohibited_count} domains with prohibited topics")
 
@@ -13,9 +13,11 @@ def analyze_missing_metrics():
     # Get current date for the report filename
     current_date = datetime.now().strftime('%Y-%m-%d')
     
-    # Initialize report content
-    report_content = f"Missing Metrics Analysis Report - {current_date}\n"
-    report_content += "=" * 50 + "\n\n"
+    # Initialize report content (joined once when the report is written)
+    report_parts = [
+        f"Missing Metrics Analysis Report - {current_date}\n",
+        "=" * 50 + "\n\n"
+    ]
     
     # List of columns to check for missing data
     columns_to_check = [
@@ -25,31 +27,45 @@ def analyze_missing_metrics():
         'English %', 'Expiry'
     ]
     
+    # Build the missing-value mask for all present columns in one pass
+    # (read_csv already maps 'N/A' cells to NaN, so isna covers them)
+    present_columns = [column for column in columns_to_check if column in df.columns]
+    missing_mask = df[present_columns].isna()
+    missing_counts = missing_mask.sum()
+    total_count = len(df)
+
+    # Scatter every missing cell to (column, row) in one scan; transposing first
+    # keeps the positions grouped by column with rows in file order
+    column_idx, row_idx = np.nonzero(missing_mask.to_numpy().T)
+    missing_names = df['Name'].to_numpy()[row_idx]
+    column_bounds = np.searchsorted(column_idx, np.arange(len(present_columns) + 1))
+    column_positions = {column: i for i, column in enumerate(present_columns)}
+
     # Analyze each column
     for column in columns_to_check:
         if column in df.columns:
-            missing_count = df[column].isna().sum()
-            total_count = len(df)
+            missing_count = missing_counts[column]
             missing_percentage = (missing_count / total_count) * 100
             
-            report_content += f"\n{column}:\n"
-            report_content += f"- Total domains: {total_count}\n"
-            report_content += f"- Missing data: {missing_count} ({missing_percentage:.2f}%)\n"
+            report_parts.append(
+                f"\n{column}:\n"
+                f"- Total domains: {total_count}\n"
+                f"- Missing data: {missing_count} ({missing_percentage:.2f}%)\n"
+            )
             
             if missing_count > 0:
                 # Get list of domains with missing data
-                missing_domains = df[df[column].isna()]['Name'].tolist()
-                report_content += "- Domains with missing data:\n"
-                for domain in missing_domains:
-                    report_content += f"  * {domain}\n"
+                i = column_positions[column]
+                missing_domains = missing_names[column_bounds[i]:column_bounds[i + 1]].tolist()
+                report_parts.append("- Domains with missing data:\n")
+                report_parts.append("".join(f"  * {domain}\n" for domain in missing_domains))
         else:
-            report_content += f"\n{column}:\n"
-            report_content += "- Column not found in the dataset\n"
+            report_parts.append(f"\n{column}:\n- Column not found in the dataset\n")
     
     # Write the report to a file
     report_filename = os.path.join(base_dir, f'missing_metrics_report_{current_date}.txt')
     with open(report_filename, 'w') as f:
-        f.write(report_content)
+        f.write("".join(report_parts))
     
     print(f"Report generated: {report_filename}")
 